@@ -0,0 +1,64 @@
+"""
+Mjerenje vremena uvoza: svaki modul se uvozi u novom Python procesu
+(hladni start), vrijeme je medijan više ponavljanja umanjen za vrijeme
+praznog interpretera. Uz vrijeme se ispisuje koje teške ovisnosti modul
+povlači.
+
+    python benchmarks/bench_import.py [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "streamlit",
+    "evidencija_baza",
+    "evidencija_grupa",
+    "evidencija_odrzavanje",
+    "evidencija_izvjestaji",
+    "stranice",
+    "stranice.pregled",
+    "stranice.uredi",
+    "stranice.zaposlenik",
+    "stranice.godisnji",
+    "stranice.arhiva",
+    "stranice.izvjestaji",
+    "stranice.odrzavanje",
+    "stranice.grupa",
+]
+HEAVY = ["streamlit", "pandas", "numpy", "pyarrow", "openpyxl", "multiprocessing"]
+
+def _run(code):
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return time.perf_counter() - start, out
+
+def measure(module, repeat):
+    code = (f"import sys, {module}; "
+            f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))")
+    times, loaded = [], ""
+    for _ in range(repeat):
+        elapsed, loaded = _run(code)
+        times.append(elapsed)
+    return statistics.median(times), loaded.strip()
+
+def main():
+    parser = argparse.ArgumentParser(description="Vrijeme uvoza modula aplikacije (hladni start)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = statistics.median(_run("pass")[0] for _ in range(args.repeat))
+    print(f"Prazan interpreter: {baseline * 1000:.0f} ms (oduzeto od rezultata)\n")
+    print(f"{'Modul':<26}{'Uvoz (ms)':>10}  Teške ovisnosti")
+    for module in MODULES:
+        elapsed, loaded = measure(module, args.repeat)
+        print(f"{module:<26}{(elapsed - baseline) * 1000:>10.0f}  {loaded or '-'}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Mjerenje prvog pokretanja i rerunova Streamlit aplikacije preko
+streamlit.testing (AppTest), na privremenoj bazi s N zaposlenika.
+Stvarna employees.db se ne dira - registar baza se preusmjerava
+varijablom okoline EVIDENCIJA_BAZE.
+
+    python benchmarks/bench_rerun.py [--employees 200] [--reruns 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+APP = os.path.join(ROOT, "evidencija_zaposlenika_app.py")
+
+def seed_database(db_path, employees):
+    from evidencija_baza import init_db, add_employee, add_leave_record, add_days_adjustment
+
+    init_db(db_path)
+    for i in range(employees):
+        add_employee({
+            'name': f"Zaposlenik {i:04d}", 'oib': f"{i:011d}", 'address': "Zagreb",
+            'birth_date': "1985-01-01", 'hire_date': f"{2000 + i % 25}-03-01",
+            'next_physical_date': "2026-01-15", 'next_psych_date': None,
+            'invalidity': i % 17 == 0, 'children_under15': i % 3, 'sole_caregiver': i % 11 == 0,
+            'previous_experience_days': (i * 97) % 4000, 'job_role_voditelj_odjela': i % 10 == 0,
+            'job_role_voditelj_grupe': i % 5 == 0, 'loyalty': i % 2, 'performance': i % 4 == 0
+        }, db_path)
+        add_leave_record(i + 1, "2025-07-01", "2025-07-10", db_path)
+        add_days_adjustment(i + 1, 2, 'add', "Prijenos", db_path)
+
+def timed_run(at):
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Vrijeme prvog pokretanja i rerunova aplikacije")
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--reruns", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "employees.db")
+        registry = os.path.join(tmp, "baze.json")
+        with open(registry, "w", encoding="utf-8") as f:
+            json.dump({"Benchmark": db_path}, f)
+        os.environ["EVIDENCIJA_BAZE"] = registry
+        seed_database(db_path, args.employees)
+
+        from streamlit.testing.v1 import AppTest
+        from stranice import PAGES
+
+        at = AppTest.from_file(APP, default_timeout=120)
+        at.session_state["authenticated"] = True
+        print(f"Baza: {args.employees} zaposlenika, {args.reruns} rerunova po stranici\n")
+        print(f"{'Prvo pokretanje':<28}{timed_run(at) * 1000:>10.0f} ms")
+
+        for page in PAGES:
+            next(s for s in at.sidebar.selectbox if s.label == "Izbornik").set_value(page)
+            first = timed_run(at)
+            reruns = [timed_run(at) for _ in range(args.reruns)]
+            print(f"{page:<28}{first * 1000:>10.0f} ms prvi, "
+                  f"{statistics.median(reruns) * 1000:.0f} ms medijan rerun")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,326 @@
+"""
+Read-only HTTP API za evidenciju zaposlenika (JSON).
+
+Pokretanje:
+    python evidencija_api.py --port 8502
+
+Rute:
+    GET /api/employees                 - popis zaposlenika
+    GET /api/employees/<id>            - zaposlenik sa stanjem godišnjeg
+    GET /api/employees/<id>/leave      - evidencija godišnjih i ručnih promjena
+    GET /api/balances                  - stanje godišnjeg za sve zaposlenike
+    GET /api/exam-alerts?days=30       - pregledi koji su istekli ili uskoro ističu
+    GET /api/archive/employees         - bivši zaposlenici (arhiva)
+    GET /api/archive/employees/<id>/leave - evidencija godišnjih bivšeg zaposlenika
+    GET /api/changes?since=0&limit=500 - dnevnik promjena nakon zadanog rednog broja
+
+Svaki odgovor nosi ETag i Last-Modified izvedene iz generacije i verzije
+podataka u bazi (tablica data_version) i današnjeg datuma, jer staž i
+godišnji ovise o danu. Generacija se mijenja kad se baza zamijeni, pa druga
+baza s istim brojem verzije ne dobije isti ETag. ETag sadrži i sažetak
+putanje i parametara, pa vrijedi samo za resurs za koji je izdan.
+
+Prije provjere uvjetnih zaglavlja rade se samo jeftine provjere (ruta i
+parametri - neispravan parametar daje 400). Verzija se čita iz baze samo
+kad se datoteka baze promijeni, pa nepromijenjeni resurs dobije 304 bez
+upita u SQLite. Greške (npr. 404) ne nose ETag, pa ga klijent ne može
+poslati za resurs koji nije postojao.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, time, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse, parse_qs, urlencode
+
+import evidencija_baza
+from evidencija_baza import (
+    EMPLOYEE_COLUMNS, init_db, get_data_version, get_employees, get_leave_records,
+    get_archived_employees, get_archived_leave_records, parse_date,
+    compute_used_days, get_exam_alerts
+)
+from evidencija_dnevnik import BalanceStore, balance_row, get_changes
+
+# Polja zaposlenika koja API vraća
+EMPLOYEE_FIELDS = EMPLOYEE_COLUMNS + ['termination_date']
+# Najviše promjena dnevnika po zahtjevu
+MAX_CHANGES_LIMIT = 1000
+
+# Stanja godišnjeg se nakon promjene računaju samo za promijenjene zaposlenike
+balance_store = BalanceStore()
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class DataVersionCache:
+    """
+    Pamti (verzija, vrijeme promjene, generacija) iz baze dok se datoteka
+    baze i njen WAL ne promijene. Provjera je samo os.stat, bez otvaranja
+    SQLite veze. API ne mijenja shemu: baza koja ne postoji ili nema
+    tablicu data_version daje 503.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._signature = None
+        self._version = None
+
+    def _stat_signature(self):
+        signature = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                st = os.stat(path)
+                signature.append((st.st_ino, st.st_size, st.st_mtime_ns))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def get(self):
+        # Potpis se uzima prije upita - promjena nakon njega mijenja potpis
+        signature = self._stat_signature()
+        with self._lock:
+            if signature != self._signature:
+                # sqlite3.connect bi stvorio praznu datoteku na mjestu baze koja ne postoji
+                if signature[0] is None:
+                    raise ApiError(503, "Baza ne postoji")
+                try:
+                    self._version = get_data_version(self.db_path)
+                except sqlite3.OperationalError:
+                    # Npr. učitana starija baza bez tablice data_version - shemu ažurira aplikacija
+                    raise ApiError(503, "Baza nije inicijalizirana - pokrenite aplikaciju ili init_db")
+                # Pamti se potpis od prije upita: ako je promjena stigla nakon
+                # čitanja verzije, sljedeći poziv vidi drugi potpis i čita ponovno
+                self._signature = signature
+            return self._version
+
+
+# Resursi
+def _employee_json(emp):
+    return {field: emp.get(field) for field in EMPLOYEE_FIELDS}
+
+def _find_employee(emp_id):
+    emp = next((e for e in get_employees() if e['id'] == emp_id), None)
+    if emp is None:
+        raise ApiError(404, f"Zaposlenik {emp_id} ne postoji")
+    return emp
+
+def _balance_json(emp):
+    return balance_row(emp)
+
+def list_employees(params):
+    return [_employee_json(e) for e in get_employees()]
+
+def employee_detail(params, emp_id):
+    emp = _find_employee(emp_id)
+    return dict(_employee_json(emp), balance=_balance_json(emp))
+
+def _ledger_json(leave_records):
+    ledger = []
+    for record in leave_records:
+        ledger.append({
+            'id': record['id'],
+            'start_date': parse_date(record['start']),
+            'end_date': parse_date(record['end']),
+            'days': compute_used_days([record]) if record['adjustment'] is None else None,
+            'adjustment': record['adjustment'],
+            'note': record['note']
+        })
+    return sorted(ledger, key=lambda r: (r['start_date'], r['id']))
+
+def employee_leave(params, emp_id):
+    _find_employee(emp_id)
+    return _ledger_json(get_leave_records(emp_id))
+
+def list_balances(params):
+    return balance_store.balances()
+
+def _int_param(query, name, default):
+    try:
+        return int(query.get(name, [str(default)])[0])
+    except ValueError:
+        raise ApiError(400, f"Parametar '{name}' mora biti cijeli broj")
+
+def exam_alerts(params):
+    return get_exam_alerts(get_employees(), params['days'])
+
+def list_archived_employees(params):
+    return [dict(_employee_json(e), archived_at=e['archived_at']) for e in get_archived_employees()]
+
+def archived_employee_leave(params, emp_id):
+    if not any(e['id'] == emp_id for e in get_archived_employees()):
+        raise ApiError(404, f"Bivši zaposlenik {emp_id} ne postoji u arhivi")
+    return _ledger_json(get_archived_leave_records(emp_id))
+
+def list_changes(params):
+    limit = min(max(params['limit'], 1), MAX_CHANGES_LIMIT)
+    return get_changes(params['since'], limit)
+
+# (putanja, resurs, cjelobrojni parametri upita sa zadanim vrijednostima)
+ROUTES = [
+    (re.compile(r'^/api/employees/?$'), list_employees, {}),
+    (re.compile(r'^/api/employees/(\d+)/?$'), employee_detail, {}),
+    (re.compile(r'^/api/employees/(\d+)/leave/?$'), employee_leave, {}),
+    (re.compile(r'^/api/balances/?$'), list_balances, {}),
+    (re.compile(r'^/api/exam-alerts/?$'), exam_alerts, {'days': 30}),
+    (re.compile(r'^/api/archive/employees/?$'), list_archived_employees, {}),
+    (re.compile(r'^/api/archive/employees/(\d+)/leave/?$'), archived_employee_leave, {}),
+    (re.compile(r'^/api/changes/?$'), list_changes, {'since': 0, 'limit': MAX_CHANGES_LIMIT}),
+]
+
+def _resource_tag(path, params):
+    """Sažetak putanje i parametara - ETag jednog resursa ne vrijedi za drugi"""
+    key = path.rstrip('/') + '?' + urlencode(sorted(params.items()))
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:12]
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = "TedingEvidencijaAPI/1.0"
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+    def _method_not_allowed(self):
+        self._send_json(405, {'error': "Dozvoljeni su samo GET i HEAD zahtjevi"},
+                        extra_headers={'Allow': 'GET, HEAD'})
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = _method_not_allowed
+
+    def _handle(self, send_body):
+        url = urlparse(self.path)
+        for pattern, resource, param_defaults in ROUTES:
+            match = pattern.match(url.path)
+            if match:
+                break
+        else:
+            self._send_json(404, {'error': "Nepoznata ruta"}, send_body=send_body)
+            return
+
+        # Samo jeftine provjere prije uvjetnih zaglavlja - bez upita u bazu
+        try:
+            query = parse_qs(url.query)
+            params = {name: _int_param(query, name, default) for name, default in param_defaults.items()}
+            version, modified_at, generation = self.server.versions.get()
+        except ApiError as e:
+            self._send_json(e.status, {'error': e.message}, send_body=send_body)
+            return
+        args = [int(g) for g in match.groups()]
+
+        today = date.today()
+        etag = f'"{_resource_tag(url.path, params)}-{generation}-{version}-{today.isoformat()}"'
+        # Podaci se "mijenjaju" i u ponoć jer staž i godišnji ovise o datumu
+        db_modified = datetime.strptime(modified_at, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+        day_start = datetime.combine(today, time.min).astimezone(timezone.utc)
+        last_modified = max(db_modified, day_start)
+        cache_headers = {
+            'ETag': etag,
+            'Last-Modified': format_datetime(last_modified, usegmt=True),
+            'Cache-Control': 'no-cache'
+        }
+
+        if self._not_modified(etag, last_modified):
+            self.send_response(304)
+            for name, value in cache_headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+
+        # Verzija je pročitana prije podataka - promjena u međuvremenu daje
+        # stariji ETag uz novije podatke, pa klijent samo ponovno dohvati
+        try:
+            payload = resource(params, *args)
+        except ApiError as e:
+            self._send_json(e.status, {'error': e.message}, send_body=send_body)
+            return
+        except Exception as e:
+            self.log_error("Greška pri obradi %s: %r", self.path, e)
+            self._send_json(500, {'error': "Interna greška"}, send_body=send_body)
+            return
+        self._send_json(200, payload, extra_headers=cache_headers, send_body=send_body)
+
+    def _not_modified(self, etag, last_modified):
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            # If-None-Match ima prednost pred If-Modified-Since
+            tags = [t.strip() for t in if_none_match.split(',')]
+            return '*' in tags or any(t.removeprefix('W/') == etag for t in tags)
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return last_modified.replace(microsecond=0) <= since
+        return False
+
+    def _send_json(self, status, payload, extra_headers=None, send_body=True):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+
+class ThreadPoolHTTPServer(HTTPServer):
+    """HTTPServer koji zahtjeve obrađuje u fiksnom bazenu dretvi"""
+
+    def __init__(self, server_address, handler_class, workers=8):
+        super().__init__(server_address, handler_class)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api")
+        self.versions = DataVersionCache(evidencija_baza.DB_PATH)
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Read-only HTTP API za evidenciju zaposlenika")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--workers", type=int, default=8, help="broj dretvi za obradu zahtjeva")
+    args = parser.parse_args()
+
+    init_db()
+    server = ThreadPoolHTTPServer((args.host, args.port), ApiHandler, workers=args.workers)
+    print(f"API sluša na http://{args.host}:{args.port} (baza: {evidencija_baza.DB_PATH})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
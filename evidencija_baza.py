@@ -0,0 +1,682 @@
+import sqlite3
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, date
+from dateutil.relativedelta import relativedelta
+import os
+import shutil
+
+# Funkcije za formatiranje datuma
+def format_date(date_str):
+    """Pretvara datum iz YYYY-MM-DD u DD/MM/YYYY format"""
+    if not date_str:
+        return ""
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d').strftime('%d/%m/%Y')
+    except:
+        return date_str
+
+def parse_date(date_str):
+    """Pretvara datum iz DD/MM/YYYY u YYYY-MM-DD format za bazu"""
+    if not date_str:
+        return ""
+    try:
+        # Prvo pokušaj s kosim crtama
+        return datetime.strptime(date_str, '%d/%m/%Y').strftime('%Y-%m-%d')
+    except ValueError:
+        try:
+            # Ako ne uspije, pokušaj s točkama
+            return datetime.strptime(date_str, '%d.%m.%Y').strftime('%Y-%m-%d')
+        except ValueError:
+            try:
+                # Ako je već u YYYY-MM-DD formatu
+                return datetime.strptime(date_str, '%Y-%m-%d').strftime('%Y-%m-%d')
+            except Exception:
+                return date_str
+
+# 1. Postavi bazu u isti folder kao aplikacija
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_PATH = os.path.join(BASE_DIR, "employees.db")
+
+# 2. Automatski backup baze (opcionalno, možeš pozvati ručno ili automatski)
+def backup_db(db_path=None):
+    db_path = db_path or DB_PATH
+    stem = os.path.splitext(os.path.basename(db_path))[0]
+    backup_name = os.path.join(os.path.dirname(db_path), f"{stem}_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db")
+    if os.path.exists(db_path):
+        shutil.copyfile(db_path, backup_name)
+
+# backup_db()  # Otkomeniraj ako želiš automatski backup na svakom pokretanju
+
+# Kolone zaposlenika koje se prenose u arhivu
+EMPLOYEE_COLUMNS = [
+    'id', 'name', 'oib', 'address', 'birth_date', 'hire_date',
+    'next_physical_date', 'next_psych_date', 'invalidity', 'children_under15',
+    'sole_caregiver', 'previous_experience_days', 'job_role_voditelj_odjela',
+    'job_role_voditelj_grupe', 'loyalty', 'performance'
+]
+LEAVE_RECORD_COLUMNS = ['id', 'emp_id', 'start_date', 'end_date', 'days_adjustment', 'note']
+
+# Kolone dodane nakon prve verzije tablice employees
+ADDED_EMPLOYEE_COLUMNS = [
+    ('oib', 'TEXT'),
+    ('address', 'TEXT'),
+    ('birth_date', 'TEXT'),
+    ('previous_experience_days', 'INTEGER NOT NULL DEFAULT 0'),
+    ('job_role_voditelj_odjela', 'INTEGER NOT NULL DEFAULT 0'),
+    ('job_role_voditelj_grupe', 'INTEGER NOT NULL DEFAULT 0'),
+    ('loyalty', 'INTEGER NOT NULL DEFAULT 0'),
+    ('performance', 'INTEGER NOT NULL DEFAULT 0'),
+    ('termination_date', 'TEXT'),
+]
+
+# Tablice čije promjene povećavaju verziju podataka
+VERSIONED_TABLES = ["employees", "leave_records"]
+
+# Tablice čije se promjene bilježe u dnevnik: (kolone, kolona s ID-em zaposlenika)
+JOURNALED_TABLES = {
+    'employees': (EMPLOYEE_COLUMNS + ['termination_date'], 'id'),
+    'leave_records': (LEAVE_RECORD_COLUMNS, 'emp_id'),
+}
+
+# Korisnik koji radi promjene - triggeri ga čitaju iz tablice journal_actor
+# (uz njega i oznaku brisanja, npr. ARCHIVE kad se redak premješta u arhivu)
+current_actor = ContextVar('current_actor', default=None)
+
+def set_current_actor(actor):
+    current_actor.set(actor)
+
+@contextmanager
+def _journaled(c, delete_operation=None):
+    """
+    Promjene unutar bloka bilježe se u dnevnik pod trenutnim korisnikom.
+    `delete_operation` zamjenjuje operaciju DELETE u dnevniku (npr. ARCHIVE).
+    """
+    c.execute('UPDATE journal_actor SET actor=?, delete_operation=? WHERE id=1',
+              (current_actor.get(), delete_operation))
+    yield
+    c.execute('UPDATE journal_actor SET actor=NULL, delete_operation=NULL WHERE id=1')
+
+def _journal_trigger_sql(table, event):
+    columns, emp_column = JOURNALED_TABLES[table]
+
+    def row_json(ref):
+        return "json_object(" + ", ".join(f"'{col}', {ref}.{col}" for col in columns) + ")"
+
+    ref = 'OLD' if event == 'DELETE' else 'NEW'
+    operation = ("COALESCE((SELECT delete_operation FROM journal_actor WHERE id = 1), 'DELETE')"
+                 if event == 'DELETE' else f"'{event}'")
+    old_data = row_json('OLD') if event != 'INSERT' else 'NULL'
+    new_data = row_json('NEW') if event != 'DELETE' else 'NULL'
+    # UPDATE bez stvarne promjene (npr. spremanje neizmijenjene forme) se ne bilježi
+    when = f"\n        WHEN {old_data} IS NOT {new_data}" if event == 'UPDATE' else ""
+    return f'''CREATE TRIGGER {table}_{event.lower()}_journal
+        AFTER {event} ON {table}{when}
+        BEGIN
+            INSERT INTO change_journal
+                (table_name, operation, row_id, emp_id, old_data, new_data, changed_at, changed_by)
+            VALUES ('{table}', {operation}, {ref}.id, {ref}.{emp_column}, {old_data}, {new_data},
+                    strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'),
+                    (SELECT actor FROM journal_actor WHERE id = 1));
+        END'''
+
+# 3. Inicijalizacija baze
+def init_db(db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    # Nova baza odmah dobiva inkrementalni vacuum (postojeće prelaze u evidencija_odrzavanje)
+    c.execute('PRAGMA auto_vacuum = INCREMENTAL')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            oib TEXT,
+            address TEXT,
+            birth_date TEXT,
+            hire_date TEXT NOT NULL,
+            next_physical_date TEXT,
+            next_psych_date TEXT,
+            invalidity INTEGER NOT NULL DEFAULT 0,
+            children_under15 INTEGER NOT NULL DEFAULT 0,
+            sole_caregiver INTEGER NOT NULL DEFAULT 0,
+            previous_experience_days INTEGER NOT NULL DEFAULT 0,
+            job_role_voditelj_odjela INTEGER NOT NULL DEFAULT 0,
+            job_role_voditelj_grupe INTEGER NOT NULL DEFAULT 0,
+            loyalty INTEGER NOT NULL DEFAULT 0,
+            performance INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+
+    # Dodaj nove kolone ako ne postoje (ALTER samo za kolone koje nedostaju)
+    existing_columns = {row[1] for row in c.execute('PRAGMA table_info(employees)')}
+    for column, definition in ADDED_EMPLOYEE_COLUMNS:
+        if column not in existing_columns:
+            c.execute(f'ALTER TABLE employees ADD COLUMN {column} {definition}')
+
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS leave_records (
+            id INTEGER PRIMARY KEY,
+            emp_id INTEGER NOT NULL,
+            start_date TEXT NOT NULL,
+            end_date TEXT NOT NULL,
+            days_adjustment INTEGER DEFAULT NULL,
+            note TEXT DEFAULT NULL,
+            FOREIGN KEY(emp_id) REFERENCES employees(id)
+        )
+    ''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_leave_records_emp_id ON leave_records(emp_id)')
+
+    # Arhiva bivših zaposlenika - zakonsko čuvanje podataka
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS employees_archive (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            oib TEXT,
+            address TEXT,
+            birth_date TEXT,
+            hire_date TEXT NOT NULL,
+            next_physical_date TEXT,
+            next_psych_date TEXT,
+            invalidity INTEGER NOT NULL DEFAULT 0,
+            children_under15 INTEGER NOT NULL DEFAULT 0,
+            sole_caregiver INTEGER NOT NULL DEFAULT 0,
+            previous_experience_days INTEGER NOT NULL DEFAULT 0,
+            job_role_voditelj_odjela INTEGER NOT NULL DEFAULT 0,
+            job_role_voditelj_grupe INTEGER NOT NULL DEFAULT 0,
+            loyalty INTEGER NOT NULL DEFAULT 0,
+            performance INTEGER NOT NULL DEFAULT 0,
+            termination_date TEXT NOT NULL,
+            archived_at TEXT NOT NULL
+        )
+    ''')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS leave_records_archive (
+            id INTEGER NOT NULL,
+            emp_id INTEGER NOT NULL,
+            start_date TEXT NOT NULL,
+            end_date TEXT NOT NULL,
+            days_adjustment INTEGER DEFAULT NULL,
+            note TEXT DEFAULT NULL,
+            FOREIGN KEY(emp_id) REFERENCES employees_archive(id)
+        )
+    ''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_leave_records_archive_emp_id ON leave_records_archive(emp_id)')
+
+    # Verzija podataka - povećava se triggerima na svakoj promjeni
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS data_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL,
+            modified_at TEXT NOT NULL,
+            generation TEXT
+        )
+    ''')
+    # Generacija razlikuje baze s istim brojem verzije (npr. svaka stara baza počinje od 0)
+    if 'generation' not in {row[1] for row in c.execute('PRAGMA table_info(data_version)')}:
+        c.execute('ALTER TABLE data_version ADD COLUMN generation TEXT')
+    c.execute("INSERT OR IGNORE INTO data_version (id, version, modified_at) "
+              "VALUES (1, 0, strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))")
+    c.execute("UPDATE data_version SET generation = lower(hex(randomblob(8))) "
+              "WHERE id = 1 AND generation IS NULL")
+    for table in VERSIONED_TABLES:
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            c.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_version
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE data_version
+                    SET version = version + 1,
+                        modified_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+                    WHERE id = 1;
+                END
+            ''')
+
+    # Dnevnik promjena (change data capture) - samo dodavanje, seq nikad ne pada
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS change_journal (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            table_name TEXT NOT NULL,
+            operation TEXT NOT NULL,
+            row_id INTEGER NOT NULL,
+            emp_id INTEGER,
+            old_data TEXT,
+            new_data TEXT,
+            changed_at TEXT NOT NULL,
+            changed_by TEXT
+        )
+    ''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_change_journal_emp_id ON change_journal(emp_id, seq)')
+    # Dnevnik je revizijski trag - postojeći zapisi se ne smiju mijenjati ni brisati
+    for event in ("UPDATE", "DELETE"):
+        c.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS change_journal_no_{event.lower()}
+            BEFORE {event} ON change_journal
+            BEGIN
+                SELECT RAISE(ABORT, 'Dnevnik promjena je samo za dodavanje');
+            END
+        ''')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS journal_actor (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            actor TEXT,
+            delete_operation TEXT
+        )
+    ''')
+    if 'delete_operation' not in {row[1] for row in c.execute('PRAGMA table_info(journal_actor)')}:
+        c.execute('ALTER TABLE journal_actor ADD COLUMN delete_operation TEXT')
+    c.execute('INSERT OR IGNORE INTO journal_actor (id, actor) VALUES (1, NULL)')
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS journal_checkpoints (
+            consumer TEXT PRIMARY KEY,
+            seq INTEGER NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    ''')
+    # Triggeri se ponovno stvaraju samo kad se promijeni njihov SQL (npr. popis kolona)
+    for table in JOURNALED_TABLES:
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            name = f"{table}_{event.lower()}_journal"
+            sql = _journal_trigger_sql(table, event)
+            c.execute("SELECT sql FROM sqlite_master WHERE type='trigger' AND name=?", (name,))
+            existing = c.fetchone()
+            if existing is None or existing[0] != sql:
+                c.execute(f'DROP TRIGGER IF EXISTS {name}')
+                c.execute(sql)
+    conn.commit()
+    conn.close()
+
+def get_data_version(db_path=None):
+    """
+    Vraća (verzija, vrijeme zadnje promjene u UTC, generacija) iz tablice
+    data_version. Verzija je smislena samo uz generaciju baze.
+    """
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute('SELECT version, modified_at, generation FROM data_version WHERE id=1')
+    row = c.fetchone()
+    conn.close()
+    return row
+
+def new_data_generation(db_path=None):
+    """
+    Nova generacija baze - poziva se kad se datoteka baze zamijeni (učitavanje,
+    vraćanje sigurnosne kopije), da se podaci druge baze ne poistovjete s
+    ranije viđenom verzijom u ETagu ili ključu izvještaja.
+    """
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute("UPDATE data_version SET generation = lower(hex(randomblob(8))), "
+              "modified_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now') WHERE id=1")
+    conn.commit()
+    conn.close()
+
+# CRUD funkcije
+def get_employees(db_path=None):
+    """Aktivni zaposlenici - bez onih kojima je radni odnos već prestao"""
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute("SELECT * FROM employees WHERE termination_date IS NULL OR termination_date > date('now', 'localtime')")
+    cols = [d[0] for d in c.description]
+    result = [dict(zip(cols, row)) for row in c.fetchall()]
+    conn.close()
+    return result
+
+def get_leave_records(emp_id, db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute('SELECT id, start_date, end_date, days_adjustment, note FROM leave_records WHERE emp_id=?', (emp_id,))
+    result = [{'id': r[0], 'start': format_date(r[1]), 'end': format_date(r[2]),
+               'adjustment': r[3], 'note': r[4]} for r in c.fetchall()]
+    conn.close()
+    return result
+
+def add_employee(data, db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    try:
+        # Zaključavanje prije čitanja MAX(id) - dvije istovremene sesije ne smiju dobiti isti ID
+        c.execute('BEGIN IMMEDIATE')
+        # ID se ne smije ponoviti s ID-em arhiviranog zaposlenika
+        c.execute('SELECT MAX(id) FROM (SELECT id FROM employees UNION ALL SELECT id FROM employees_archive)')
+        emp_id = (c.fetchone()[0] or 0) + 1
+        with _journaled(c):
+            c.execute('''INSERT INTO employees
+                         (id, name, oib, address, birth_date, hire_date,
+                          next_physical_date, next_psych_date,
+                          invalidity, children_under15, sole_caregiver,
+                          previous_experience_days, job_role_voditelj_odjela, job_role_voditelj_grupe, loyalty, performance)
+                         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                     (emp_id, data['name'], data['oib'], data['address'], data['birth_date'],
+                      data['hire_date'], data['next_physical_date'], data['next_psych_date'],
+                      data['invalidity'], data['children_under15'], data['sole_caregiver'],
+                      data['previous_experience_days'], data['job_role_voditelj_odjela'], data['job_role_voditelj_grupe'], data['loyalty'], data['performance']))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def edit_employee(emp_id, data, db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    with _journaled(c):
+        c.execute('''UPDATE employees
+                     SET name=?, oib=?, address=?, birth_date=?, hire_date=?,
+                         next_physical_date=?, next_psych_date=?,
+                         invalidity=?, children_under15=?, sole_caregiver=?,
+                         previous_experience_days=?, job_role_voditelj_odjela=?, job_role_voditelj_grupe=?, loyalty=?, performance=?
+                     WHERE id=?''',
+                 (data['name'], data['oib'], data['address'], data['birth_date'],
+                  data['hire_date'], data['next_physical_date'], data['next_psych_date'],
+                  data['invalidity'], data['children_under15'], data['sole_caregiver'],
+                  data['previous_experience_days'], data['job_role_voditelj_odjela'], data['job_role_voditelj_grupe'], data['loyalty'], data['performance'], emp_id))
+    conn.commit()
+    conn.close()
+
+def add_leave_record(emp_id, s, e, db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    with _journaled(c):
+        c.execute('INSERT INTO leave_records (emp_id, start_date, end_date) VALUES (?, ?, ?)',
+                  (emp_id, s, e))
+    conn.commit()
+    conn.close()
+
+def add_days_adjustment(emp_id, days, operation='add', note=None, db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    days_value = days if operation == 'add' else -days
+    today = date.today().strftime('%Y-%m-%d')
+    with _journaled(c):
+        c.execute('INSERT INTO leave_records(emp_id,start_date,end_date,days_adjustment,note) VALUES (?,?,?,?,?)',
+                  (emp_id, today, today, days_value, note))
+    conn.commit()
+    conn.close()
+
+def delete_leave_record(emp_id, record_id, db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    with _journaled(c):
+        c.execute('DELETE FROM leave_records WHERE emp_id=? AND id=?', (emp_id, record_id))
+    conn.commit()
+    conn.close()
+
+def terminate_employee(emp_id, termination_date, db_path=None):
+    """
+    Bilježi prestanak radnog odnosa. Ako je datum danas ili ranije,
+    zaposlenik se odmah premješta u arhivu, inače na taj dan.
+    """
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    with _journaled(c):
+        c.execute('UPDATE employees SET termination_date=? WHERE id=?', (termination_date, emp_id))
+    conn.commit()
+    conn.close()
+    archive_terminated_employees(db_path)
+
+def cancel_termination(emp_id, db_path=None):
+    """
+    Poništava zabilježeni prestanak radnog odnosa zaposlenika koji još nije
+    premješten u arhivu. Vraća False ako zaposlenik nema datum prestanka.
+    """
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    with _journaled(c):
+        c.execute('UPDATE employees SET termination_date=NULL WHERE id=? AND termination_date IS NOT NULL',
+                  (emp_id,))
+        cancelled = c.rowcount > 0
+    conn.commit()
+    conn.close()
+    return cancelled
+
+def archive_terminated_employees(db_path=None):
+    """
+    Premješta zaposlenike kojima je prestao radni odnos, zajedno s njihovom
+    evidencijom godišnjih, u employees_archive/leave_records_archive.
+    Vraća broj arhiviranih zaposlenika.
+    """
+    emp_cols = ', '.join(EMPLOYEE_COLUMNS)
+    leave_cols = ', '.join(LEAVE_RECORD_COLUMNS)
+    due = "SELECT id FROM employees WHERE termination_date <= date('now', 'localtime')"
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    try:
+        c.execute('BEGIN IMMEDIATE')
+        c.execute(f'INSERT INTO leave_records_archive ({leave_cols}) '
+                  f'SELECT {leave_cols} FROM leave_records WHERE emp_id IN ({due})')
+        c.execute(f"INSERT INTO employees_archive ({emp_cols}, termination_date, archived_at) "
+                  f"SELECT {emp_cols}, termination_date, strftime('%Y-%m-%dT%H:%M:%SZ', 'now') "
+                  f"FROM employees WHERE id IN ({due})")
+        archived = c.rowcount
+        # Brisanja zbog arhiviranja ulaze u dnevnik kao ARCHIVE, a ne kao DELETE
+        with _journaled(c, delete_operation='ARCHIVE'):
+            c.execute(f'DELETE FROM leave_records WHERE emp_id IN ({due})')
+            c.execute(f'DELETE FROM employees WHERE id IN ({due})')
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return archived
+
+def get_archived_employees(db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute('SELECT * FROM employees_archive ORDER BY termination_date DESC, name')
+    cols = [d[0] for d in c.description]
+    result = [dict(zip(cols, row)) for row in c.fetchall()]
+    conn.close()
+    return result
+
+def get_archived_leave_records(emp_id, db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute('SELECT id, start_date, end_date, days_adjustment, note FROM leave_records_archive WHERE emp_id=?', (emp_id,))
+    result = [{'id': r[0], 'start': format_date(r[1]), 'end': format_date(r[2]),
+               'adjustment': r[3], 'note': r[4]} for r in c.fetchall()]
+    conn.close()
+    return result
+
+# Business logic
+def compute_tenure(hire, until=None):
+    d = datetime.strptime(until, '%Y-%m-%d').date() if until else date.today()
+    h = datetime.strptime(hire, '%Y-%m-%d').date()
+    return relativedelta(d, h)
+
+def format_rd(rd):
+    """
+    Formatira relativedelta u string, pretvarajući dane preko 30 u mjesece.
+    Primjer: 1g 3m 45d -> 1g 4m 15d
+    """
+    years = rd.years
+    months = rd.months
+    days = rd.days
+
+    # Pretvaranje dana preko 30 u mjesece
+    if days >= 30:
+        additional_months = days // 30
+        months += additional_months
+        days = days % 30
+
+    # Pretvaranje mjeseci preko 12 u godine
+    if months >= 12:
+        additional_years = months // 12
+        years += additional_years
+        months = months % 12
+
+    parts = []
+    if years: parts.append(f"{years}g")
+    if months: parts.append(f"{months}m")
+    if days: parts.append(f"{days}d")
+    return ' '.join(parts) or '0d'
+
+def compute_leave(hire, invalidity, children, sole, previous_experience_days=0, job_role_voditelj_odjela=0, job_role_voditelj_grupe=0, loyalty=0, performance=0):
+    """
+    Računanje godišnjeg odmora prema pravilniku:
+    - Osnovno: 20 dana
+    - Invaliditet: +5 dana
+    - Samohrani roditelj: +3 dana
+    - Djeca: 1 dijete = +1 dan, 2 ili više = +2 dana
+    - Ukupni radni staž: 10-20g = +1 dan, 20-30g = +2 dana, 30+ = +3 dana
+    - Voditelj odjela i poslovnih jedinica: +2 dana
+    - Voditelj grupe i poslovođa: +1 dan
+    - Lojalnost: +1 dan
+    - Učinak: +1 dan
+    """
+    return sum(days for _, days in compute_leave_breakdown(
+        hire, invalidity, children, sole, previous_experience_days,
+        job_role_voditelj_odjela, job_role_voditelj_grupe, loyalty, performance))
+
+def compute_leave_breakdown(hire, invalidity, children, sole, previous_experience_days=0, job_role_voditelj_odjela=0, job_role_voditelj_grupe=0, loyalty=0, performance=0):
+    """Stavke godišnjeg odmora prema pravilniku kao lista (opis, dana)"""
+    staz_kod_nas = relativedelta(date.today(), datetime.strptime(hire, '%Y-%m-%d').date())
+    staz_kod_nas_days = staz_kod_nas.years * 365 + staz_kod_nas.months * 30 + staz_kod_nas.days
+    ukupni_staz_dani = previous_experience_days + staz_kod_nas_days
+    ukupni_staz_godina = ukupni_staz_dani // 365
+    items = [("Osnovno", 20)]
+    if invalidity:
+        items.append(("Invaliditet", 5))
+    if 10 <= ukupni_staz_godina < 20:
+        items.append(("Radni staž 10-20 godina", 1))
+    elif 20 <= ukupni_staz_godina < 30:
+        items.append(("Radni staž 20-30 godina", 2))
+    elif ukupni_staz_godina >= 30:
+        items.append(("Radni staž 30+ godina", 3))
+    if sole:
+        items.append(("Samohrani roditelj", 3))
+    if children == 1:
+        items.append(("Jedno dijete mlađe od 15 godina", 1))
+    if children >= 2:
+        items.append(("Dvoje ili više djece mlađe od 15 godina", 2))
+    # Složenost posla
+    if job_role_voditelj_odjela:
+        items.append(("Voditelj odjela i poslovnih jedinica", 2))
+    if job_role_voditelj_grupe:
+        items.append(("Voditelj grupe i poslovođa", 1))
+    # Lojalnost i učinak
+    if loyalty:
+        items.append(("Lojalnost", 1))
+    if performance:
+        items.append(("Učinak", 1))
+    return items
+
+def compute_employee_leave(emp):
+    """Godišnji prema pravilniku za zapis zaposlenika iz get_employees()"""
+    return compute_leave(emp['hire_date'], emp['invalidity'],
+                         emp['children_under15'], emp['sole_caregiver'],
+                         emp.get('previous_experience_days', 0),
+                         emp.get('job_role_voditelj_odjela', 0), emp.get('job_role_voditelj_grupe', 0),
+                         emp.get('loyalty', 0), emp.get('performance', 0))
+
+def compute_used_days(leave_records):
+    """Iskorišteni dani: korišteni godišnji minus ručno dodani dani"""
+    used_days = 0
+    for record in leave_records:
+        if record['adjustment'] is None:
+            start = datetime.strptime(parse_date(record['start']), '%Y-%m-%d').date()
+            end = datetime.strptime(parse_date(record['end']), '%Y-%m-%d').date()
+            used_days += (end - start).days + 1
+        else:
+            used_days -= record['adjustment']
+    return used_days
+
+def compute_balance(emp, db_path=None):
+    """Vraća (godišnji prema pravilniku, iskorišteno, preostalo) za zaposlenika"""
+    leave_days = compute_employee_leave(emp)
+    used_days = compute_used_days(get_leave_records(emp['id'], db_path))
+    return leave_days, used_days, leave_days - used_days
+
+def get_exam_alerts(employees, within_days=30):
+    """
+    Vraća fizičke i psihičke preglede koji su istekli ili ističu
+    u sljedećih `within_days` dana, sortirane po datumu.
+    """
+    today = date.today()
+    alerts = []
+    for emp in employees:
+        for exam, key in (('physical', 'next_physical_date'), ('psych', 'next_psych_date')):
+            if not emp.get(key):
+                continue
+            try:
+                exam_date = datetime.strptime(emp[key], '%Y-%m-%d').date()
+            except ValueError:
+                continue
+            days_left = (exam_date - today).days
+            if days_left <= within_days:
+                alerts.append({
+                    'emp_id': emp['id'],
+                    'name': emp['name'],
+                    'exam': exam,
+                    'date': emp[key],
+                    'days_left': days_left,
+                    'overdue': days_left < 0
+                })
+    return sorted(alerts, key=lambda a: a['date'])
+
+def build_overview_rows(db_path=None):
+    """Redovi tablice "Pregled zaposlenika" za sve aktivne zaposlenike"""
+    rows = []
+    for e in get_employees(db_path):
+        # Staž prije
+        total_days = e.get('previous_experience_days', 0)
+        years = total_days // 365
+        remaining_days = total_days % 365
+        months = remaining_days // 30
+        days = remaining_days % 30
+        staz_prije_str = f"{years}g {months}m {days}d" if total_days else "0d"
+
+        # Staž kod nas
+        staz_kod_nas = compute_tenure(e['hire_date'])
+        staz_kod_nas_str = format_rd(staz_kod_nas)
+        staz_kod_nas_days = staz_kod_nas.years * 365 + staz_kod_nas.months * 30 + staz_kod_nas.days
+
+        # Ukupni staž
+        ukupni_staz = relativedelta(date.today(), datetime.strptime(e['hire_date'], '%Y-%m-%d').date())
+        ukupni_staz = relativedelta(
+            years=ukupni_staz.years + years,
+            months=ukupni_staz.months + months,
+            days=ukupni_staz.days + days
+        )
+        ukupni_staz_str = format_rd(ukupni_staz)
+        ukupni_staz_days = ukupni_staz.years * 365 + ukupni_staz.months * 30 + ukupni_staz.days
+
+        leave = compute_employee_leave(e)
+
+        # Računanje ukupno iskorištenih dana
+        used = compute_used_days(get_leave_records(e['id'], db_path))
+
+        rem = leave - used
+
+        fiz_pregled = format_date(e['next_physical_date']) or 'Nema pregleda'
+        psih_pregled = format_date(e['next_psych_date']) or 'Nema pregleda'
+
+        fiz_pregled_sort = parse_date_for_sort(fiz_pregled)
+        psih_pregled_sort = parse_date_for_sort(psih_pregled)
+
+        rows.append({
+            'Ime': e['name'],
+            'Datum zapos.': e['hire_date'],
+            'Staž prije': staz_prije_str,
+            'Staž kod nas': staz_kod_nas_str,
+            'Ukupni staž': ukupni_staz_str,
+            'Godišnji prema pravilniku (dana)': leave,
+            'Preostalo godišnji': rem,
+            'Sljedeći fiz. pregled': fiz_pregled_sort,
+            'Sljedeći psih. pregled': psih_pregled_sort
+        })
+    return rows
+
+def parse_date_for_sort(date_str):
+    # Vrati string datuma u formatu YYYY-MM-DD ili 'Nema pregleda' ako nema pregleda
+    try:
+        if date_str and date_str != "Nema pregleda":
+            try:
+                dt = datetime.strptime(date_str, "%d/%m/%Y")
+            except:
+                dt = datetime.strptime(date_str, "%Y-%m-%d")
+            return dt.strftime("%Y-%m-%d")
+    except:
+        return "Nema pregleda"
+    return "Nema pregleda"
@@ -0,0 +1,290 @@
+"""
+Dnevnik promjena (change data capture) nad tablicama employees i
+leave_records.
+
+SQLite triggeri (vidi init_db) upisuju svaki INSERT, UPDATE i DELETE u
+tablicu change_journal sa stalno rastućim rednim brojem (seq), starim i
+novim sadržajem retka (JSON), vremenom i korisnikom koji je napravio
+promjenu. Redak premješten u arhivu bilježi se s operacijom ARCHIVE
+umjesto DELETE. U dnevnik se samo dodaje.
+
+Izvedeni podaci (stanja godišnjeg, cache, izvozi) ne moraju se graditi
+iznova nakon svake promjene: JournalConsumer pamti zadnji obrađeni seq
+(checkpoint) i predaje samo promjene nastale nakon njega, npr.:
+
+    consumer = JournalConsumer("izvoz-place")
+    consumer.poll(lambda changes: ...)
+
+Pregled dnevnika iz komandne linije:
+    python evidencija_dnevnik.py [--od SEQ] [--zaposlenik ID] [--db putanja]
+"""
+import argparse
+import json
+import sqlite3
+import threading
+from datetime import datetime, date
+
+from evidencija_baza import DB_PATH, format_date, get_data_version, get_employees, compute_balance
+
+# Nazivi polja za opis promjena u povijesti zaposlenika
+EMPLOYEE_FIELD_LABELS = {
+    'name': "Ime i prezime",
+    'oib': "OIB",
+    'address': "Adresa",
+    'birth_date': "Datum rođenja",
+    'hire_date': "Datum zaposlenja",
+    'next_physical_date': "Fizički pregled",
+    'next_psych_date': "Psihički pregled",
+    'invalidity': "Status invaliditeta",
+    'children_under15': "Broj djece <15",
+    'sole_caregiver': "Samohrani roditelj",
+    'previous_experience_days': "Staž prije (dana)",
+    'job_role_voditelj_odjela': "Voditelj odjela i poslovnih jedinica",
+    'job_role_voditelj_grupe': "Voditelj grupe i poslovođa",
+    'loyalty': "Lojalnost",
+    'performance': "Učinak",
+    'termination_date': "Datum prestanka radnog odnosa"
+}
+
+def _change_from_row(row):
+    seq, table_name, operation, row_id, emp_id, old_data, new_data, changed_at, changed_by = row
+    return {
+        'seq': seq,
+        'table': table_name,
+        'operation': operation,
+        'row_id': row_id,
+        'emp_id': emp_id,
+        'old': json.loads(old_data) if old_data else None,
+        'new': json.loads(new_data) if new_data else None,
+        'changed_at': changed_at,
+        'changed_by': changed_by
+    }
+
+def get_changes(since_seq=0, limit=None, emp_id=None, db_path=None):
+    """Promjene sa seq većim od `since_seq`, uzlazno po seq"""
+    query = '''SELECT seq, table_name, operation, row_id, emp_id, old_data, new_data,
+                      changed_at, changed_by
+               FROM change_journal WHERE seq > ?'''
+    params = [since_seq]
+    if emp_id is not None:
+        query += ' AND emp_id = ?'
+        params.append(emp_id)
+    query += ' ORDER BY seq'
+    if limit is not None:
+        query += ' LIMIT ?'
+        params.append(limit)
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute(query, params)
+    result = [_change_from_row(r) for r in c.fetchall()]
+    conn.close()
+    return result
+
+def get_latest_seq(db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute('SELECT MAX(seq) FROM change_journal')
+    result = c.fetchone()[0] or 0
+    conn.close()
+    return result
+
+def get_checkpoint(consumer, db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute('SELECT seq FROM journal_checkpoints WHERE consumer=?', (consumer,))
+    row = c.fetchone()
+    conn.close()
+    return row[0] if row else 0
+
+def save_checkpoint(consumer, seq, db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute('''INSERT INTO journal_checkpoints (consumer, seq, updated_at)
+                 VALUES (?, ?, ?)
+                 ON CONFLICT(consumer) DO UPDATE SET seq=excluded.seq, updated_at=excluded.updated_at''',
+              (consumer, seq, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+    conn.commit()
+    conn.close()
+
+
+class JournalConsumer:
+    """
+    Čita dnevnik od zadnjeg checkpointa u serijama. Ako je `persistent`,
+    checkpoint se sprema u tablicu journal_checkpoints pa preživljava
+    ponovno pokretanje; inače se pamti samo u memoriji.
+    """
+
+    def __init__(self, name, db_path=None, batch_size=500, persistent=True):
+        self.name = name
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.persistent = persistent
+        self._lock = threading.Lock()
+        self.seq = get_checkpoint(name, db_path) if persistent else 0
+
+    def pending(self):
+        """Broj promjena koje potrošač još nije obradio"""
+        return max(get_latest_seq(self.db_path) - self.seq, 0)
+
+    def reset(self, seq=0):
+        with self._lock:
+            self._set_seq(seq)
+
+    def _set_seq(self, seq):
+        self.seq = seq
+        if self.persistent:
+            save_checkpoint(self.name, seq, self.db_path)
+
+    def poll(self, apply_changes):
+        """
+        Predaje nove promjene funkciji `apply_changes(changes)` serijom po
+        serijom. Checkpoint se pomiče tek kad serija uspješno prođe, pa se
+        nakon greške ista serija ponovno predaje. Vraća broj obrađenih promjena.
+        """
+        processed = 0
+        with self._lock:
+            while True:
+                changes = get_changes(self.seq, self.batch_size, db_path=self.db_path)
+                if not changes:
+                    break
+                apply_changes(changes)
+                self._set_seq(changes[-1]['seq'])
+                processed += len(changes)
+        return processed
+
+
+def balance_row(emp, db_path=None):
+    leave_days, used_days, remaining_days = compute_balance(emp, db_path)
+    return {
+        'emp_id': emp['id'],
+        'name': emp['name'],
+        'entitlement': leave_days,
+        'used': used_days,
+        'remaining': remaining_days
+    }
+
+class BalanceStore:
+    """
+    Stanje godišnjeg za sve zaposlenike, održavano iz dnevnika: nakon
+    prvog punog izračuna ponovno se računaju samo zaposlenici čiji se
+    podaci ili godišnji promijenili. Sve se računa iznova kad se promijeni
+    datum (staž i godišnji ovise o danu) ili generacija baze (datoteka je
+    zamijenjena drugom bazom, čiji se seq brojevi ne nastavljaju na ove).
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._consumer = JournalConsumer("stanje-godisnjeg", db_path, persistent=False)
+        self._balances = {}
+        self._day = None
+        self._generation = None
+
+    def _rebuild(self, generation):
+        # seq se čita prije izračuna - promjena nastala u međuvremenu bit će ponovno primijenjena
+        seq = get_latest_seq(self.db_path)
+        self._balances = {e['id']: balance_row(e, self.db_path) for e in get_employees(self.db_path)}
+        self._consumer.reset(seq)
+        self._day = date.today()
+        self._generation = generation
+
+    def _apply(self, changes):
+        emp_ids = {change['emp_id'] for change in changes if change['emp_id'] is not None}
+        # get_employees izostavlja zaposlenike kojima je prestao radni odnos
+        employees = {e['id']: e for e in get_employees(self.db_path) if e['id'] in emp_ids}
+        for emp_id in emp_ids:
+            if emp_id in employees:
+                self._balances[emp_id] = balance_row(employees[emp_id], self.db_path)
+            else:
+                self._balances.pop(emp_id, None)
+
+    def refresh(self):
+        """Primjenjuje nove promjene iz dnevnika; vraća broj obrađenih promjena"""
+        with self._lock:
+            _, _, generation = get_data_version(self.db_path)
+            if (self._day != date.today() or generation != self._generation
+                    or get_latest_seq(self.db_path) < self._consumer.seq):
+                self._rebuild(generation)
+                return 0
+            return self._consumer.poll(self._apply)
+
+    def balances(self):
+        self.refresh()
+        with self._lock:
+            return [self._balances[emp_id] for emp_id in sorted(self._balances)]
+
+
+# Povijest promjena za prikaz u sučelju
+def get_employee_history(emp_id, db_path=None):
+    """Sve promjene zaposlenika i njegovih godišnjih, od najnovije"""
+    return list(reversed(get_changes(emp_id=emp_id, db_path=db_path)))
+
+def _format_value(field, value):
+    if value is None or value == '':
+        return "-"
+    if field.endswith('_date'):
+        return format_date(value)
+    if field in ('invalidity', 'sole_caregiver', 'job_role_voditelj_odjela',
+                 'job_role_voditelj_grupe', 'loyalty', 'performance'):
+        return "da" if value else "ne"
+    return str(value)
+
+# Glagol uz zapis godišnjeg: (muški rod za godišnji, ženski za ručnu promjenu)
+LEAVE_ACTIONS = {
+    'INSERT': ("upisan", "upisana"),
+    'UPDATE': ("izmijenjen", "izmijenjena"),
+    'DELETE': ("obrisan", "obrisana"),
+    'ARCHIVE': ("premješten u arhivu", "premještena u arhivu")
+}
+
+def _describe_leave(record, operation):
+    if record.get('days_adjustment') is None:
+        return (f"Godišnji {format_date(record['start_date'])} - {format_date(record['end_date'])} "
+                f"{LEAVE_ACTIONS[operation][0]}")
+    days = record['days_adjustment']
+    text = f"Ručna promjena {'+' if days > 0 else ''}{days} dana"
+    if record.get('note'):
+        text += f" ({record['note']})"
+    return f"{text} {LEAVE_ACTIONS[operation][1]}"
+
+def describe_change(change):
+    """Kratak opis promjene na hrvatskom"""
+    old, new = change['old'], change['new']
+    if change['table'] == 'employees':
+        if change['operation'] == 'INSERT':
+            return f"Dodan zaposlenik {new['name']}"
+        if change['operation'] == 'ARCHIVE':
+            return "Zaposlenik premješten u arhivu"
+        if change['operation'] == 'DELETE':
+            return f"Obrisan zaposlenik {old['name']}"
+        changed = [field for field in EMPLOYEE_FIELD_LABELS if old.get(field) != new.get(field)]
+        return "; ".join(
+            f"{EMPLOYEE_FIELD_LABELS[field]}: {_format_value(field, old.get(field))} → "
+            f"{_format_value(field, new.get(field))}"
+            for field in changed
+        ) or "Izmijenjeni podaci"
+    return _describe_leave(new if new is not None else old, change['operation'])
+
+def history_rows(changes):
+    """Redovi za tablicu povijesti u sučelju"""
+    return [{
+        'Vrijeme': datetime.strptime(change['changed_at'], '%Y-%m-%d %H:%M:%S').strftime('%d/%m/%Y %H:%M'),
+        'Korisnik': change['changed_by'] or "sustav",
+        'Promjena': describe_change(change),
+        'Br.': change['seq']
+    } for change in changes]
+
+def main():
+    parser = argparse.ArgumentParser(description="Pregled dnevnika promjena evidencije zaposlenika")
+    parser.add_argument("--db", default=None, help="putanja do baze (zadano employees.db)")
+    parser.add_argument("--od", dest="since", type=int, default=0, help="prikaži promjene nakon ovog rednog broja")
+    parser.add_argument("--zaposlenik", dest="emp_id", type=int, default=None)
+    args = parser.parse_args()
+
+    for change in get_changes(args.since, emp_id=args.emp_id, db_path=args.db):
+        print(f"{change['seq']:>6}  {change['changed_at']}  {change['changed_by'] or 'sustav':<10}  "
+              f"[{change['emp_id']}] {describe_change(change)}")
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
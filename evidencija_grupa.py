@@ -0,0 +1,120 @@
+"""
+Registar više baza (jedna employees.db po tvrtki ili podružnici) i grupni
+pregled preko svih registriranih baza.
+
+Registar se čita iz datoteke baze.json pored aplikacije ili iz datoteke
+zadane varijablom okoline EVIDENCIJA_BAZE, npr.:
+
+    {
+        "Teding d.o.o.": "employees.db",
+        "Teding Split": "/srv/teding/split/employees.db"
+    }
+
+Relativne putanje su u odnosu na folder datoteke registra. Bez registra
+koristi se samo zadana baza (DB_PATH), kao i do sada. Baze navedene u
+registru nikad se ne stvaraju: baza koje nema preskače se i prijavljuje,
+da krivo upisana putanja ne bi tiho dala praznu bazu.
+
+Izvoz grupnog pregleda iz komandne linije:
+    python evidencija_grupa.py grupni_pregled.csv
+"""
+import argparse
+import csv
+import json
+import os
+
+from evidencija_baza import BASE_DIR, DB_PATH, build_overview_rows
+
+REGISTRY_ENV = "EVIDENCIJA_BAZE"
+REGISTRY_PATH = os.path.join(BASE_DIR, "baze.json")
+DEFAULT_DB_NAME = "Teding"
+
+OVERVIEW_COLUMNS = [
+    "Tvrtka", "Ime", "Datum zapos.", "Staž prije", "Staž kod nas", "Ukupni staž",
+    "Godišnji prema pravilniku (dana)", "Preostalo godišnji",
+    "Sljedeći fiz. pregled", "Sljedeći psih. pregled"
+]
+
+def registry_file():
+    """Putanja datoteke registra ili None ako registra nema"""
+    path = os.environ.get(REGISTRY_ENV, REGISTRY_PATH)
+    return path if os.path.exists(path) else None
+
+def load_registry():
+    """Vraća {naziv: putanja do baze} redom kojim su baze navedene u registru"""
+    path = registry_file()
+    if path is None:
+        return {DEFAULT_DB_NAME: DB_PATH}
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    if not isinstance(entries, dict) or not entries:
+        raise ValueError(f"Registar baza {path} mora biti neprazan JSON objekt {{naziv: putanja}}")
+    registry_dir = os.path.dirname(os.path.abspath(path))
+    return {name: os.path.normpath(os.path.join(registry_dir, db_path))
+            for name, db_path in entries.items()}
+
+def load_available_databases():
+    """
+    Vraća (baze koje postoje, {naziv: putanja} baza iz registra kojih nema).
+    Zadana baza bez registra smije se stvoriti pri prvom pokretanju.
+    """
+    registry = load_registry()
+    if registry_file() is None:
+        return registry, {}
+    available = {name: db_path for name, db_path in registry.items() if os.path.isfile(db_path)}
+    missing = {name: db_path for name, db_path in registry.items() if name not in available}
+    return available, missing
+
+def _company_overview_rows(db_path):
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"Baza {db_path} ne postoji")
+    return build_overview_rows(db_path)
+
+def aggregate_overview(registry, use_processes=False, max_workers=None):
+    """
+    Paralelno računa pregled zaposlenika za svaku bazu iz registra i spaja
+    rezultate uz stupac "Tvrtka". Vraća (redovi, {naziv: greška}) - greška
+    u jednoj bazi ne ruši pregled ostalih.
+    """
+    # Uvoz tek ovdje - učitavanje registra ne treba multiprocessing
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    rows, errors = [], {}
+    with executor_class(max_workers=max_workers or min(len(registry), 8)) as executor:
+        futures = {executor.submit(_company_overview_rows, db_path): name
+                   for name, db_path in registry.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                company_rows = future.result()
+            except Exception as e:
+                errors[name] = str(e)
+                continue
+            rows.extend(dict({'Tvrtka': name}, **row) for row in company_rows)
+    order = {name: i for i, name in enumerate(registry)}
+    rows.sort(key=lambda r: (order[r['Tvrtka']], r['Ime']))
+    return rows, errors
+
+def export_overview_csv(rows, path):
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.DictWriter(f, fieldnames=OVERVIEW_COLUMNS, delimiter=';')
+        writer.writeheader()
+        writer.writerows(rows)
+
+def main():
+    parser = argparse.ArgumentParser(description="Grupni pregled zaposlenika preko svih registriranih baza")
+    parser.add_argument("output", help="putanja izlazne CSV datoteke")
+    parser.add_argument("--processes", action="store_true", help="računaj u procesima umjesto u dretvama")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    rows, errors = aggregate_overview(load_registry(), use_processes=args.processes, max_workers=args.workers)
+    export_overview_csv(rows, args.output)
+    print(f"Izvezeno {len(rows)} zaposlenika u {args.output}")
+    for name, error in errors.items():
+        print(f"Greška u bazi {name}: {error}")
+    return 1 if errors else 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,313 @@
+"""
+Godišnji izvještaji: obračun godišnjeg odmora i staža za svakog zaposlenika
+i sažetak po radnim mjestima, u HTML ili XLSX formatu.
+
+Obračuni se računaju u bazenu procesa, a posao se vodi iz pozadinske dretve,
+pa sučelje ostaje responzivno i može prikazivati napredak. Gotove datoteke
+čuvaju se u folderu izvjestaji/ pod ključem izvedenim iz generacije baze,
+verzije podataka, današnjeg datuma i formata, pa se ponovljeni zahtjev za
+nepromijenjene podatke poslužuje iz spremljene datoteke.
+
+Generiranje iz komandne linije:
+    python evidencija_izvjestaji.py --format XLSX
+"""
+import argparse
+import hashlib
+import html
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+from dateutil.relativedelta import relativedelta
+
+from evidencija_baza import (
+    BASE_DIR, DB_PATH, get_data_version, get_employees, get_leave_records,
+    format_date, parse_date, compute_tenure, format_rd, compute_leave_breakdown,
+    compute_used_days
+)
+
+REPORTS_DIR = os.path.join(BASE_DIR, "izvjestaji")
+REPORT_FORMATS = {"HTML": ".html", "XLSX": ".xlsx"}
+# Povećati kad se promijeni sadržaj ili izgled izvještaja, da se ne koristi stari cache
+REPORT_LAYOUT_VERSION = 1
+
+def job_group(emp):
+    """Radno mjesto za sažetak - baza nema odjele, pa se grupira po složenosti posla"""
+    if emp.get('job_role_voditelj_odjela'):
+        return "Voditelj odjela i poslovnih jedinica"
+    if emp.get('job_role_voditelj_grupe'):
+        return "Voditelj grupe i poslovođa"
+    return "Ostali zaposlenici"
+
+def build_employee_statement(emp, leave_records):
+    """Obračun godišnjeg za jednog zaposlenika - izvršava se u radnom procesu"""
+    total_days = emp.get('previous_experience_days', 0) or 0
+    years, rest = divmod(total_days, 365)
+    months, days = divmod(rest, 30)
+    staz_kod_nas = compute_tenure(emp['hire_date'])
+    ukupni_staz = relativedelta(years=staz_kod_nas.years + years,
+                                months=staz_kod_nas.months + months,
+                                days=staz_kod_nas.days + days)
+
+    breakdown = compute_leave_breakdown(
+        emp['hire_date'], emp['invalidity'], emp['children_under15'], emp['sole_caregiver'],
+        total_days, emp.get('job_role_voditelj_odjela', 0), emp.get('job_role_voditelj_grupe', 0),
+        emp.get('loyalty', 0), emp.get('performance', 0))
+    entitlement = sum(d for _, d in breakdown)
+    used = compute_used_days(leave_records)
+
+    ledger = []
+    for record in sorted(leave_records, key=lambda r: (parse_date(r['start']), r['id'])):
+        is_leave = record['adjustment'] is None
+        ledger.append({
+            'Od': record['start'],
+            'Do': record['end'],
+            'Vrsta': 'Godišnji' if is_leave else 'Ručna promjena',
+            'Dana': compute_used_days([record]) if is_leave else record['adjustment'],
+            'Napomena': record['note'] or ''
+        })
+
+    return {
+        'emp_id': emp['id'],
+        'name': emp['name'],
+        'oib': emp.get('oib') or '',
+        'hire_date': format_date(emp['hire_date']),
+        'group': job_group(emp),
+        'staz_prije': format_rd(relativedelta(years=years, months=months, days=days)),
+        'staz_kod_nas': format_rd(staz_kod_nas),
+        'ukupni_staz': format_rd(ukupni_staz),
+        'breakdown': breakdown,
+        'entitlement': entitlement,
+        'used': used,
+        'remaining': entitlement - used,
+        'ledger': ledger
+    }
+
+def summarize_by_group(statements):
+    summary = {}
+    for s in statements:
+        row = summary.setdefault(s['group'], {
+            'Radno mjesto': s['group'], 'Broj zaposlenika': 0,
+            'Pravo (dana)': 0, 'Iskorišteno (dana)': 0, 'Preostalo (dana)': 0
+        })
+        row['Broj zaposlenika'] += 1
+        row['Pravo (dana)'] += s['entitlement']
+        row['Iskorišteno (dana)'] += s['used']
+        row['Preostalo (dana)'] += s['remaining']
+    return sorted(summary.values(), key=lambda r: r['Radno mjesto'])
+
+# Zapisivanje izvještaja
+def _html_table(rows, columns):
+    head = ''.join(f"<th>{html.escape(c)}</th>" for c in columns)
+    body = ''.join(
+        "<tr>" + ''.join(f"<td>{html.escape(str(row[c]))}</td>" for c in columns) + "</tr>"
+        for row in rows)
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+def write_html(statements, path, title):
+    today = date.today().strftime('%d/%m/%Y')
+    summary = summarize_by_group(statements)
+    parts = [
+        "<!DOCTYPE html><html lang='hr'><head><meta charset='utf-8'>",
+        f"<title>{html.escape(title)} - godišnji odmor {today}</title>",
+        "<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse;margin:.5em 0 1.5em}"
+        "th,td{border:1px solid #bbb;padding:4px 8px;text-align:left}th{background:#eee}"
+        "section{page-break-before:always}</style></head><body>",
+        f"<h1>{html.escape(title)} - godišnji odmor na dan {today}</h1>",
+        "<h2>Sažetak po radnim mjestima</h2>",
+        _html_table(summary, list(summary[0]) if summary else []),
+    ]
+    for s in statements:
+        parts.append(f"<section><h2>{html.escape(s['name'])}</h2>")
+        parts.append(_html_table([
+            {'Podatak': 'OIB', 'Vrijednost': s['oib'] or 'Nije unesen'},
+            {'Podatak': 'Datum zaposlenja', 'Vrijednost': s['hire_date']},
+            {'Podatak': 'Radno mjesto', 'Vrijednost': s['group']},
+            {'Podatak': 'Staž prije', 'Vrijednost': s['staz_prije']},
+            {'Podatak': 'Staž kod nas', 'Vrijednost': s['staz_kod_nas']},
+            {'Podatak': 'Ukupni staž', 'Vrijednost': s['ukupni_staz']},
+        ], ['Podatak', 'Vrijednost']))
+        parts.append("<h3>Pravo na godišnji odmor</h3>")
+        parts.append(_html_table(
+            [{'Osnova': label, 'Dana': d} for label, d in s['breakdown']]
+            + [{'Osnova': 'Ukupno', 'Dana': s['entitlement']}], ['Osnova', 'Dana']))
+        parts.append(f"<p><b>Iskorišteno:</b> {s['used']} dana &nbsp; <b>Preostalo:</b> {s['remaining']} dana</p>")
+        if s['ledger']:
+            parts.append("<h3>Evidencija korištenja</h3>")
+            parts.append(_html_table(s['ledger'], ['Od', 'Do', 'Vrsta', 'Dana', 'Napomena']))
+        parts.append("</section>")
+    parts.append("</body></html>")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(''.join(parts))
+
+def _sheet_name(name, used):
+    # Excel: najviše 31 znak, bez []:*?/\ i jedinstveno ime lista
+    base = ''.join(ch for ch in name if ch not in '[]:*?/\\')[:28] or "Zaposlenik"
+    candidate, i = base, 2
+    while candidate.lower() in used:
+        candidate, i = f"{base}~{i}", i + 1
+    used.add(candidate.lower())
+    return candidate
+
+def write_xlsx(statements, path, title):
+    import pandas as pd
+
+    overview = pd.DataFrame([{
+        'Ime': s['name'], 'OIB': s['oib'], 'Datum zapos.': s['hire_date'],
+        'Radno mjesto': s['group'], 'Staž prije': s['staz_prije'],
+        'Staž kod nas': s['staz_kod_nas'], 'Ukupni staž': s['ukupni_staz'],
+        'Pravo (dana)': s['entitlement'], 'Iskorišteno (dana)': s['used'],
+        'Preostalo (dana)': s['remaining']
+    } for s in statements])
+    used_names = {"sažetak", "zaposlenici"}
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        pd.DataFrame(summarize_by_group(statements)).to_excel(writer, sheet_name="Sažetak", index=False)
+        overview.to_excel(writer, sheet_name="Zaposlenici", index=False)
+        for s in statements:
+            sheet = _sheet_name(s['name'], used_names)
+            pd.DataFrame(
+                [{'Osnova': label, 'Dana': d} for label, d in s['breakdown']]
+                + [{'Osnova': 'Ukupno', 'Dana': s['entitlement']},
+                   {'Osnova': 'Iskorišteno', 'Dana': s['used']},
+                   {'Osnova': 'Preostalo', 'Dana': s['remaining']}]
+            ).to_excel(writer, sheet_name=sheet, index=False)
+            if s['ledger']:
+                pd.DataFrame(s['ledger']).to_excel(writer, sheet_name=sheet, index=False, startcol=3)
+        for ws in writer.sheets.values():
+            for column in ws.columns:
+                width = max(len(str(cell.value or '')) for cell in column)
+                ws.column_dimensions[column[0].column_letter].width = min(width + 2, 50)
+
+REPORT_WRITERS = {"HTML": write_html, "XLSX": write_xlsx}
+
+# Pozadinski poslovi
+def report_cache_key(report_format, db_path=None):
+    """
+    Ključ izvještaja: mijenja se s podacima u bazi, datumom (staž) i formatom.
+    Generacija razlikuje zamijenjenu bazu na istoj putanji s istim brojem verzije.
+    """
+    db_path = os.path.abspath(db_path or DB_PATH)
+    version, _, generation = get_data_version(db_path)
+    raw = f"{db_path}|{generation}|{version}|{date.today().isoformat()}|{report_format}|{REPORT_LAYOUT_VERSION}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+class ReportJob:
+    def __init__(self, key, path, report_format):
+        self.key = key
+        self.path = path
+        self.format = report_format
+        self.status = 'pending'  # pending, running, done, error
+        self.total = 0
+        self.done = 0
+        self.error = None
+        self.from_cache = False
+        self.started_at = datetime.now()
+
+    @property
+    def progress(self):
+        if self.status == 'done':
+            return 1.0
+        return self.done / self.total if self.total else 0.0
+
+class ReportManager:
+    """
+    Pokreće i prati generiranje izvještaja. Jedna instanca po procesu
+    aplikacije; bazen procesa se stvara tek kod prvog izvještaja.
+    """
+
+    def __init__(self, max_workers=None, reports_dir=REPORTS_DIR):
+        self.max_workers = max_workers
+        self.reports_dir = reports_dir
+        self._executor = None
+        self._lock = threading.Lock()
+        self._jobs = {}
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # spawn - radni procesi ne nasljeđuju dretve Streamlit servera
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'))
+            return self._executor
+
+    def get(self, key):
+        with self._lock:
+            return self._jobs.get(key)
+
+    def submit(self, report_format, db_path=None, title="Teding"):
+        key = report_cache_key(report_format, db_path)
+        stem = os.path.splitext(os.path.basename(db_path or DB_PATH))[0]
+        filename = f"godisnji_{stem}_{date.today().strftime('%Y%m%d')}_{key[:12]}{REPORT_FORMATS[report_format]}"
+        path = os.path.join(self.reports_dir, filename)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job and job.status != 'error' and (job.status != 'done' or os.path.exists(job.path)):
+                return job
+            job = ReportJob(key, path, report_format)
+            self._jobs[key] = job
+            if os.path.exists(path):
+                job.status = 'done'
+                job.from_cache = True
+                return job
+        threading.Thread(target=self._run, args=(job, db_path, title), daemon=True).start()
+        return job
+
+    def _run(self, job, db_path, title):
+        try:
+            job.status = 'running'
+            employees = sorted(get_employees(db_path), key=lambda e: e['name'])
+            job.total = len(employees)
+            executor = self._get_executor()
+            futures = [executor.submit(build_employee_statement, emp, get_leave_records(emp['id'], db_path))
+                       for emp in employees]
+            statements = []
+            for future in as_completed(futures):
+                statements.append(future.result())
+                job.done += 1
+            statements.sort(key=lambda s: (s['name'], s['emp_id']))
+
+            os.makedirs(self.reports_dir, exist_ok=True)
+            # Privremena datoteka zadržava ekstenziju (pandas po njoj bira format)
+            root, ext = os.path.splitext(job.path)
+            tmp_path = f"{root}.tmp{ext}"
+            REPORT_WRITERS[job.format](statements, tmp_path, title)
+            os.replace(tmp_path, job.path)
+            job.status = 'done'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'error'
+
+    def wait(self, job, poll_interval=0.2):
+        while job.status in ('pending', 'running'):
+            time.sleep(poll_interval)
+        return job
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+def main():
+    parser = argparse.ArgumentParser(description="Generiranje godišnjeg izvještaja o godišnjem odmoru i stažu")
+    parser.add_argument("--format", choices=list(REPORT_FORMATS), default="XLSX")
+    parser.add_argument("--db", default=None, help="putanja do baze (zadano employees.db)")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    manager = ReportManager(max_workers=args.workers)
+    try:
+        job = manager.wait(manager.submit(args.format, args.db))
+    finally:
+        manager.shutdown()
+    if job.status == 'error':
+        print(f"Greška: {job.error}")
+        return 1
+    print(("Iz cachea: " if job.from_cache else "Spremljeno: ") + job.path)
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,264 @@
+"""
+Održavanje SQLite baze: provjera integriteta (quick_check), statistike za
+planer upita (ANALYZE / PRAGMA optimize) i inkrementalni vacuum koji vraća
+prazne stranice nakon brisanja.
+
+Prebacivanje baze na auto_vacuum=INCREMENTAL zahtijeva puni VACUUM koji
+prepisuje cijelu datoteku i za to vrijeme zaključava bazu, pa se pokreće
+samo ručno (stranica "Održavanje baze" ili --pretvori-auto-vacuum).
+Automatsko održavanje radi samo inkrementalni vacuum.
+Svako pokretanje bilježi se u tablicu maintenance_log s veličinom datoteke,
+brojem praznih stranica i trajanjem svakog koraka, a u istu tablicu
+pozadinska dretva upisuje i neuspjela pokretanja.
+
+Ručno pokretanje:
+    python evidencija_odrzavanje.py [--db putanja] [--ako-je-potrebno] [--pretvori-auto-vacuum]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+from evidencija_baza import DB_PATH
+
+# Koliko često se održavanje pokreće automatski
+MAINTENANCE_INTERVAL = timedelta(days=7)
+# Koliko često pozadinska dretva provjerava treba li održavanje
+SCHEDULER_CHECK_SECONDS = 3600
+
+AUTO_VACUUM_MODES = {0: "NONE", 1: "FULL", 2: "INCREMENTAL"}
+
+# Oznaka neuspjelog pokretanja u stupcu integrity tablice maintenance_log
+FAILURE_PREFIX = "greška: "
+
+# Zadnja greška pozadinskog održavanja po bazi - za greške koje se ne mogu
+# upisati u samu bazu (npr. datoteka ne postoji)
+scheduler_errors = {}
+
+# Održavanje iste baze ne smije se pokrenuti dvaput istovremeno
+_maintenance_lock = threading.Lock()
+
+def _connect(db_path):
+    # Autocommit - VACUUM se ne može izvršiti unutar transakcije
+    conn = sqlite3.connect(db_path, isolation_level=None, timeout=30)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS maintenance_log (
+            id INTEGER PRIMARY KEY,
+            started_at TEXT NOT NULL,
+            duration_ms INTEGER NOT NULL,
+            integrity TEXT NOT NULL,
+            size_before INTEGER NOT NULL,
+            size_after INTEGER NOT NULL,
+            freelist_before INTEGER NOT NULL,
+            freelist_after INTEGER NOT NULL,
+            report TEXT NOT NULL
+        )
+    ''')
+    return conn
+
+def get_db_stats(db_path=None):
+    """Veličina datoteke, broj stranica, prazne stranice i način auto_vacuuma"""
+    db_path = db_path or DB_PATH
+    conn = sqlite3.connect(db_path)
+    page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+    page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+    freelist = conn.execute('PRAGMA freelist_count').fetchone()[0]
+    auto_vacuum = conn.execute('PRAGMA auto_vacuum').fetchone()[0]
+    conn.close()
+    return {
+        'file_size': os.path.getsize(db_path),
+        'page_size': page_size,
+        'page_count': page_count,
+        'freelist_pages': freelist,
+        'auto_vacuum': AUTO_VACUUM_MODES.get(auto_vacuum, str(auto_vacuum))
+    }
+
+def _timed(steps, name, func):
+    start = time.perf_counter()
+    result = func()
+    steps.append({'step': name, 'duration_ms': round((time.perf_counter() - start) * 1000, 1),
+                  'result': result})
+    return result
+
+def run_maintenance(db_path=None, convert_auto_vacuum=False):
+    """
+    Pokreće quick_check, ANALYZE/optimize i inkrementalni vacuum. Ako
+    quick_check javi grešku, ostali koraci se preskaču i samo se bilježi
+    rezultat. Baza koja još nije na auto_vacuum=INCREMENTAL prebacuje se
+    (puni VACUUM) samo uz `convert_auto_vacuum`. Vraća izvještaj s
+    veličinom i praznim stranicama prije i poslije te trajanjem svakog koraka.
+    """
+    db_path = db_path or DB_PATH
+    with _maintenance_lock:
+        started_at = datetime.now()
+        started = time.perf_counter()
+        before = get_db_stats(db_path)
+        steps = []
+        conn = _connect(db_path)
+        try:
+            def quick_check():
+                rows = [r[0] for r in conn.execute('PRAGMA quick_check')]
+                return 'ok' if rows == ['ok'] else '; '.join(rows)
+            integrity = _timed(steps, 'quick_check', quick_check)
+
+            if integrity == 'ok':
+                def statistics():
+                    has_stats = conn.execute(
+                        "SELECT 1 FROM sqlite_master WHERE name='sqlite_stat1'").fetchone()
+                    if has_stats:
+                        conn.execute('PRAGMA optimize')
+                        return 'PRAGMA optimize'
+                    # Prvo pokretanje - puni ANALYZE da planer dobije statistike
+                    conn.execute('ANALYZE')
+                    return 'ANALYZE'
+                _timed(steps, 'statistike', statistics)
+
+                if before['auto_vacuum'] != 'INCREMENTAL' and convert_auto_vacuum:
+                    def enable_incremental():
+                        conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+                        conn.execute('VACUUM')
+                        return 'auto_vacuum=INCREMENTAL uključen (puni VACUUM)'
+                    _timed(steps, 'auto_vacuum', enable_incremental)
+                elif before['auto_vacuum'] != 'INCREMENTAL':
+                    # Bez auto_vacuum=INCREMENTAL pragma incremental_vacuum ništa ne oslobađa
+                    steps.append({'step': 'auto_vacuum', 'duration_ms': 0,
+                                  'result': 'preskočeno - prebacivanje na INCREMENTAL pokreće se ručno'})
+                else:
+                    def incremental_vacuum():
+                        freed = conn.execute('PRAGMA freelist_count').fetchone()[0]
+                        # executescript izvršava pragmu do kraja (execute oslobodi samo jednu stranicu)
+                        conn.executescript('PRAGMA incremental_vacuum;')
+                        return f'oslobođeno {freed} stranica'
+                    _timed(steps, 'incremental_vacuum', incremental_vacuum)
+            else:
+                # Na oštećenoj bazi ne pokreću se koraci koji pišu po datoteci
+                for step in ('statistike', 'vacuum'):
+                    steps.append({'step': step, 'duration_ms': 0,
+                                  'result': 'preskočeno - quick_check nije prošao'})
+
+            after = get_db_stats(db_path)
+            report = {
+                'started_at': started_at.strftime('%Y-%m-%d %H:%M:%S'),
+                'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+                'integrity': integrity,
+                'before': before,
+                'after': after,
+                'steps': steps
+            }
+            conn.execute('''INSERT INTO maintenance_log
+                            (started_at, duration_ms, integrity, size_before, size_after,
+                             freelist_before, freelist_after, report)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
+                         (report['started_at'], int(report['duration_ms']), integrity,
+                          before['file_size'], after['file_size'],
+                          before['freelist_pages'], after['freelist_pages'],
+                          json.dumps(report, ensure_ascii=False)))
+        finally:
+            conn.close()
+    return report
+
+def log_failure(db_path, started_at, error):
+    """Bilježi neuspjelo održavanje u maintenance_log"""
+    stats = get_db_stats(db_path)
+    report = {
+        'started_at': started_at.strftime('%Y-%m-%d %H:%M:%S'),
+        'duration_ms': 0,
+        'integrity': f"{FAILURE_PREFIX}{error}",
+        'before': stats,
+        'after': stats,
+        'steps': []
+    }
+    conn = _connect(db_path)
+    conn.execute('''INSERT INTO maintenance_log
+                    (started_at, duration_ms, integrity, size_before, size_after,
+                     freelist_before, freelist_after, report)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
+                 (report['started_at'], 0, report['integrity'], stats['file_size'], stats['file_size'],
+                  stats['freelist_pages'], stats['freelist_pages'], json.dumps(report, ensure_ascii=False)))
+    conn.close()
+
+def get_maintenance_log(db_path=None, limit=10):
+    conn = _connect(db_path or DB_PATH)
+    c = conn.cursor()
+    c.execute('SELECT report FROM maintenance_log ORDER BY id DESC LIMIT ?', (limit,))
+    result = [json.loads(r[0]) for r in c.fetchall()]
+    conn.close()
+    return result
+
+def maintenance_due(db_path=None, interval=MAINTENANCE_INTERVAL):
+    conn = _connect(db_path or DB_PATH)
+    # Neuspjelo pokretanje ne odgađa sljedeće - pokušava se pri sljedećoj provjeri
+    last = conn.execute('SELECT MAX(started_at) FROM maintenance_log WHERE integrity NOT LIKE ?',
+                        (FAILURE_PREFIX + '%',)).fetchone()[0]
+    conn.close()
+    if last is None:
+        return True
+    return datetime.now() - datetime.strptime(last, '%Y-%m-%d %H:%M:%S') >= interval
+
+def run_if_due(db_path=None, interval=MAINTENANCE_INTERVAL):
+    """Pokreće održavanje ako od zadnjeg pokretanja prošlo više od `interval`"""
+    if maintenance_due(db_path, interval):
+        return run_maintenance(db_path)
+    return None
+
+def run_scheduled(db_paths, interval=MAINTENANCE_INTERVAL):
+    """
+    Jedan prolaz pozadinskog održavanja. Baze kojih nema se preskaču (ne
+    stvaraju se), a greška se upisuje u maintenance_log te baze - ili u
+    scheduler_errors ako ni to ne uspije - i ne prekida ostale baze.
+    """
+    for db_path in db_paths:
+        if not os.path.isfile(db_path):
+            scheduler_errors[db_path] = f"Baza {db_path} ne postoji"
+            continue
+        started_at = datetime.now()
+        try:
+            run_if_due(db_path, interval)
+            scheduler_errors.pop(db_path, None)
+        except Exception as e:
+            try:
+                log_failure(db_path, started_at, e)
+                scheduler_errors.pop(db_path, None)
+            except Exception as log_error:
+                scheduler_errors[db_path] = f"{e} (zapis u maintenance_log nije uspio: {log_error})"
+
+def start_scheduler(db_paths, interval=MAINTENANCE_INTERVAL, check_seconds=SCHEDULER_CHECK_SECONDS):
+    """
+    Pokreće pozadinsku dretvu koja periodično održava zadane baze.
+    Greška u jednoj bazi ne zaustavlja dretvu.
+    """
+    def loop():
+        while True:
+            run_scheduled(db_paths, interval)
+            time.sleep(check_seconds)
+
+    thread = threading.Thread(target=loop, name="odrzavanje-baze", daemon=True)
+    thread.start()
+    return thread
+
+def main():
+    parser = argparse.ArgumentParser(description="Održavanje SQLite baze zaposlenika")
+    parser.add_argument("--db", default=None, help="putanja do baze (zadano employees.db)")
+    parser.add_argument("--ako-je-potrebno", dest="if_due", action="store_true",
+                        help="pokreni samo ako je prošao interval održavanja")
+    parser.add_argument("--pretvori-auto-vacuum", dest="convert", action="store_true",
+                        help="prebaci bazu na auto_vacuum=INCREMENTAL (puni VACUUM, zaključava bazu)")
+    args = parser.parse_args()
+    if args.if_due and args.convert:
+        parser.error("--pretvori-auto-vacuum se pokreće samo ručno, bez --ako-je-potrebno")
+
+    if args.if_due:
+        report = run_if_due(args.db)
+    else:
+        report = run_maintenance(args.db, convert_auto_vacuum=args.convert)
+    if report is None:
+        print("Održavanje nije potrebno.")
+        return 0
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0 if report['integrity'] == 'ok' else 1
+
+if __name__ == '__main__':
+    raise SystemExit(main())
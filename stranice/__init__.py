@@ -0,0 +1,22 @@
+"""
+Stranice aplikacije. Svaki modul ima funkciju render(db_path, db_name, databases),
+a učitava se tek kad korisnik odabere stranicu u izborniku, pa se ovisnosti
+ostalih stranica (pandas, izvještaji...) ne uvoze na svakom pokretanju.
+"""
+import importlib
+
+# Naziv u izborniku -> modul stranice, redom kojim se prikazuju
+PAGES = {
+    "Pregled zaposlenika": "stranice.pregled",
+    "Dodaj/Uredi zaposlenika": "stranice.uredi",
+    "Pregledaj zaposlenika": "stranice.zaposlenik",
+    "Evidencija godišnjih": "stranice.godisnji",
+    "Arhiva zaposlenika": "stranice.arhiva",
+    "Izvještaji": "stranice.izvjestaji",
+    "Održavanje baze": "stranice.odrzavanje",
+}
+# Prikazuje se samo kad je registrirano više baza
+GROUP_PAGE = ("Grupni pregled", "stranice.grupa")
+
+def render_page(module_name, db_path, db_name, databases):
+    importlib.import_module(module_name).render(db_path, db_name, databases)
@@ -0,0 +1,81 @@
+"""Arhiva zaposlenika - povijest zaposlenja i bivši zaposlenici"""
+import streamlit as st
+import pandas as pd
+
+from evidencija_baza import (
+    format_date, parse_date, get_employees, get_leave_records, get_archived_employees,
+    get_archived_leave_records, compute_tenure, format_rd, compute_used_days
+)
+from evidencija_dnevnik import get_employee_history, history_rows
+
+def render(db_path, db_name, databases):
+    archived = get_archived_employees(db_path)
+
+    # Povijest zaposlenja - aktivni i bivši zaposlenici
+    st.markdown("### Povijest zaposlenja")
+    rows = []
+    for e in get_employees(db_path) + archived:
+        until = e['termination_date'] if e.get('archived_at') else None
+        leave_records = get_archived_leave_records(e['id'], db_path) if until else get_leave_records(e['id'], db_path)
+        rows.append({
+            'Ime': e['name'],
+            'OIB': e['oib'] or '',
+            'Datum zapos.': format_date(e['hire_date']),
+            'Datum odlaska': format_date(e['termination_date']) if e.get('termination_date') else '',
+            'Status': 'Bivši' if until else 'Aktivan',
+            'Staž kod nas': format_rd(compute_tenure(e['hire_date'], until)),
+            'Iskorišteno godišnjeg (dana)': compute_used_days(leave_records)
+        })
+    history = pd.DataFrame(rows)
+    if history.empty:
+        st.warning("Nema zaposlenika u bazi!")
+    else:
+        st.dataframe(history, use_container_width=True)
+        st.download_button(
+            label="⬇️ Preuzmi povijest zaposlenja (CSV)",
+            data=history.to_csv(index=False).encode('utf-8-sig'),
+            file_name="povijest_zaposlenja.csv",
+            mime="text/csv"
+        )
+
+    # Pojedinačni bivši zaposlenik
+    st.markdown("### Bivši zaposlenici")
+    if not archived:
+        st.info("Arhiva je prazna.")
+        return
+
+    labels = [f"{e['name']} (odlazak {format_date(e['termination_date'])})" for e in archived]
+    selected = st.selectbox("Odaberi bivšeg zaposlenika", labels)
+    emp = archived[labels.index(selected)]
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write(f"**Ime i prezime:** {emp['name']}")
+        st.write(f"**OIB:** {emp['oib'] or 'Nije unesen'}")
+        st.write(f"**Adresa:** {emp['address'] or 'Nije unesena'}")
+        st.write(f"**Datum rođenja:** {format_date(emp['birth_date']) or 'Nije unesen'}")
+    with col2:
+        st.write(f"**Datum zaposlenja:** {format_date(emp['hire_date'])}")
+        st.write(f"**Datum odlaska:** {format_date(emp['termination_date'])}")
+        st.write(f"**Staž kod nas:** {format_rd(compute_tenure(emp['hire_date'], emp['termination_date']))}")
+
+    st.markdown("#### Evidencija godišnjih")
+    leave_records = get_archived_leave_records(emp['id'], db_path)
+    if leave_records:
+        ledger = pd.DataFrame([{
+            'Od': r['start'],
+            'Do': r['end'],
+            'Vrsta': 'Godišnji' if r['adjustment'] is None else 'Ručna promjena',
+            'Dana': compute_used_days([r]) if r['adjustment'] is None else r['adjustment'],
+            'Napomena': r['note'] or ''
+        } for r in sorted(leave_records, key=lambda x: parse_date(x['start']))])
+        st.dataframe(ledger, use_container_width=True)
+    else:
+        st.info("Nema zapisa o godišnjem.")
+
+    st.markdown("#### Povijest promjena")
+    history = get_employee_history(emp['id'], db_path)
+    if history:
+        st.dataframe(pd.DataFrame(history_rows(history)), use_container_width=True, hide_index=True)
+    else:
+        st.info("Nema zabilježenih promjena.")
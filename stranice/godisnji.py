@@ -0,0 +1,135 @@
+"""Evidencija godišnjih - korištenje godišnjeg i ručne promjene dana"""
+import streamlit as st
+from datetime import datetime
+
+from evidencija_baza import (
+    format_date, parse_date, get_employees, get_leave_records, add_leave_record,
+    add_days_adjustment, delete_leave_record, compute_employee_leave, compute_used_days
+)
+
+def render(db_path, db_name, databases):
+    employees = get_employees(db_path)
+    if not employees:
+        st.warning("Nema zaposlenika u bazi.")
+        return
+        
+    selected = st.selectbox("Odaberi zaposlenika", [emp['name'] for emp in employees])
+    emp = next(emp for emp in employees if emp['name'] == selected)
+    
+    # Osnovni podaci o godišnjem
+    st.markdown("### Godišnji odmor")
+    leave_days = compute_employee_leave(emp)
+    
+    # Računanje iskorištenih dana
+    leave_records = get_leave_records(emp['id'], db_path)
+    used_days = compute_used_days(leave_records)
+    
+    remaining_days = leave_days - used_days
+    
+    st.write(f"**Godišnji prema pravilniku (dana):** {leave_days}")
+    st.write(f"**Preostalo dana:** {remaining_days}")
+
+    # Povijest promjena (samo za dodavanje/oduzimanje dana)
+    st.markdown("### Povijest promjena")
+    adjustment_records = [r for r in leave_records if r['adjustment'] is not None]
+    if adjustment_records:
+        for record in sorted(adjustment_records, key=lambda x: parse_date(x['start']), reverse=True):
+            col1, col2 = st.columns([6, 1])
+            with col1:
+                operation = "Dodano" if record['adjustment'] > 0 else "Oduzeto"
+                broj = abs(record['adjustment'])
+                dan_text = "dan" if broj == 1 else "dana"
+                napomena_text = f": {record['note']}" if record['note'] else ""
+                st.write(f"**{format_date(record['start'])}**: {operation} {broj} {dan_text}{napomena_text}")
+            with col2:
+                if st.button("Obriši", key=f"del_record_{record['id']}", use_container_width=True):
+                    delete_leave_record(emp['id'], record['id'], db_path)
+                    st.rerun()
+
+    # Ručno podešavanje dana
+    st.markdown("### Ručno podešavanje dana")
+    with st.container():
+        col1, col2 = st.columns([1,3])
+        
+        with col1:
+            days = st.number_input("Broj dana", min_value=1, value=1)
+        with col2:
+            napomena = st.text_input("Napomena")
+        
+        col3, col4 = st.columns(2)
+        with col3:
+            if st.button("➕ Dodaj", use_container_width=True, type="secondary"):
+                try:
+                    add_days_adjustment(emp['id'], days, 'add', napomena, db_path)
+                    st.success("✅ Dodano!")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Greška: {str(e)}")
+        with col4:
+            if st.button("➖ Oduzmi", use_container_width=True, type="secondary"):
+                try:
+                    add_days_adjustment(emp['id'], days, 'subtract', napomena, db_path)
+                    st.success("✅ Oduzeto!")
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"❌ Greška: {str(e)}")
+
+    # Evidencija korištenja
+    st.markdown("### Evidencija korištenja")
+    st.markdown("#### Dodaj novi godišnji")
+
+    # Jednostavnija forma bez kolona
+    with st.form("godisnji_forma"):
+        try:
+            start_date = st.date_input(
+                "Početak godišnjeg",
+                value=None,
+                format="DD/MM/YYYY"
+            )
+            
+            end_date = st.date_input(
+                "Kraj godišnjeg",
+                value=None,
+                format="DD/MM/YYYY"
+            )
+            
+            submitted = st.form_submit_button("Dodaj godišnji")
+            
+            if submitted:
+                if start_date and end_date:
+                    if start_date <= end_date:
+                        try:
+                            # Pretvaranje datuma u string format za bazu
+                            start_str = start_date.strftime('%Y-%m-%d')
+                            end_str = end_date.strftime('%Y-%m-%d')
+                            add_leave_record(emp['id'], start_str, end_str, db_path)
+                            st.success("✅ Godišnji uspješno dodan!")
+                        except Exception as e:
+                            st.error(f"❌ Greška pri spremanju: {str(e)}")
+                    else:
+                        st.error("❌ Datum početka mora biti prije ili jednak datumu završetka!")
+                else:
+                    st.error("❌ Molimo unesite oba datuma!")
+        except Exception as e:
+            st.error(f"❌ Greška pri unosu datuma: {str(e)}")
+
+    # Prikaz postojećih godišnjih (izvan forme)
+    leave_usage_records = [r for r in leave_records if r['adjustment'] is None]
+    
+    if leave_usage_records:
+        st.markdown("#### Postojeći godišnji")
+        for record in sorted(leave_usage_records, key=lambda x: parse_date(x['start']), reverse=True):
+            col1, col2, col3, col4 = st.columns([2,2,2,1])
+            with col1:
+                st.write(f"**Od:** {record['start']}")
+            with col2:
+                st.write(f"**Do:** {record['end']}")
+            with col3:
+                start = datetime.strptime(parse_date(record['start']), '%Y-%m-%d').date()
+                end = datetime.strptime(parse_date(record['end']), '%Y-%m-%d').date()
+                days = (end - start).days + 1
+                st.write(f"**Broj dana:** {days}")
+            with col4:
+                if st.button("Obriši", key=f"del_leave_{record['id']}", use_container_width=True):
+                    delete_leave_record(emp['id'], record['id'], db_path)
+                    st.rerun()
@@ -0,0 +1,31 @@
+"""Grupni pregled - zbirni pregled svih registriranih baza"""
+import streamlit as st
+import pandas as pd
+
+from evidencija_grupa import aggregate_overview
+
+def render(db_path, db_name, databases):
+    st.markdown("### Grupni pregled svih tvrtki")
+    with st.spinner("Računam preglede svih baza..."):
+        rows, errors = aggregate_overview(databases)
+    for name, error in errors.items():
+        st.error(f"❌ {name}: {error}")
+
+    df = pd.DataFrame(rows)
+    if df.empty:
+        st.warning("Nema zaposlenika ni u jednoj bazi!")
+        return
+
+    summary = df.groupby("Tvrtka", sort=False).agg(**{
+        "Broj zaposlenika": ("Ime", "count"),
+        "Godišnji prema pravilniku (dana)": ("Godišnji prema pravilniku (dana)", "sum"),
+        "Preostalo godišnji": ("Preostalo godišnji", "sum")
+    })
+    st.dataframe(summary, use_container_width=True)
+    st.dataframe(df.reset_index(drop=True), use_container_width=True, height=800)
+    st.download_button(
+        label="⬇️ Preuzmi grupni pregled (CSV)",
+        data=df.to_csv(index=False, sep=';').encode('utf-8-sig'),
+        file_name="grupni_pregled.csv",
+        mime="text/csv"
+    )
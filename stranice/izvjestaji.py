@@ -0,0 +1,46 @@
+"""Izvještaji - pozadinsko generiranje godišnjih izvještaja"""
+import os
+import time
+
+import streamlit as st
+
+from evidencija_izvjestaji import ReportManager, REPORT_FORMATS
+
+# Jedan upravitelj izvještaja (i bazen procesa) za cijeli proces aplikacije
+@st.cache_resource
+def get_report_manager():
+    return ReportManager()
+
+def render(db_path, db_name, databases):
+    st.markdown("### Godišnji izvještaji")
+    st.caption("Obračun godišnjeg odmora i staža za svakog zaposlenika te sažetak po radnim mjestima.")
+    report_format = st.radio("Format", list(REPORT_FORMATS), horizontal=True)
+    manager = get_report_manager()
+
+    if st.button("📄 Generiraj izvještaj"):
+        job = manager.submit(report_format, db_path, title=f"Teding - {db_name}")
+        st.session_state['report_job'] = job.key
+
+    job = manager.get(st.session_state.get('report_job'))
+    if job is None:
+        return
+    if job.status in ('pending', 'running'):
+        # Izvještaj se generira u pozadini - osvježavaj prikaz napretka
+        st.progress(job.progress, text=f"Obrađeno {job.done}/{job.total} zaposlenika...")
+        time.sleep(0.5)
+        st.rerun()
+    elif job.status == 'error':
+        st.error(f"❌ Greška pri generiranju izvještaja: {job.error}")
+    else:
+        if job.from_cache:
+            st.info("Podaci se nisu mijenjali - izvještaj je preuzet iz spremljenih.")
+        else:
+            st.success("✅ Izvještaj je generiran!")
+        with open(job.path, "rb") as f:
+            st.download_button(
+                label=f"⬇️ Preuzmi izvještaj ({job.format})",
+                data=f,
+                file_name=os.path.basename(job.path),
+                mime="text/html" if job.format == "HTML" else
+                     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            )
@@ -0,0 +1,62 @@
+"""Održavanje baze - statistike, ručno pokretanje i povijest održavanja"""
+import streamlit as st
+import pandas as pd
+
+import evidencija_odrzavanje
+
+def run_maintenance(db_path, convert_auto_vacuum=False):
+    with st.spinner("Održavanje u tijeku..."):
+        try:
+            report = evidencija_odrzavanje.run_maintenance(db_path, convert_auto_vacuum)
+        except Exception as e:
+            st.error(f"❌ Greška pri održavanju: {str(e)}")
+            return
+    if report['integrity'] == 'ok':
+        st.success(f"✅ Održavanje završeno za {report['duration_ms']:.0f} ms")
+    else:
+        st.error(f"❌ Provjera integriteta: {report['integrity']}")
+    st.dataframe(pd.DataFrame(report['steps']).rename(columns={
+        'step': 'Korak', 'duration_ms': 'Trajanje (ms)', 'result': 'Rezultat'
+    }), use_container_width=True)
+
+def render(db_path, db_name, databases):
+    st.markdown("### Održavanje baze")
+    st.caption("Provjera integriteta, statistike za upite (ANALYZE) i vraćanje praznog prostora "
+               f"(incremental vacuum). Automatski se pokreće svakih {evidencija_odrzavanje.MAINTENANCE_INTERVAL.days} dana.")
+
+    stats = evidencija_odrzavanje.get_db_stats(db_path)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Veličina datoteke", f"{stats['file_size'] / 1024:.1f} KB")
+    col2.metric("Prazne stranice", f"{stats['freelist_pages']} / {stats['page_count']}")
+    col3.metric("Auto vacuum", stats['auto_vacuum'])
+
+    scheduler_error = evidencija_odrzavanje.scheduler_errors.get(db_path)
+    if scheduler_error:
+        st.warning(f"⚠️ Automatsko održavanje nije uspjelo: {scheduler_error}")
+
+    if st.button("🛠️ Pokreni održavanje"):
+        run_maintenance(db_path)
+
+    # Pretvorba prepisuje cijelu datoteku - nikad se ne pokreće automatski
+    if stats['auto_vacuum'] != 'INCREMENTAL':
+        st.info("Baza nije na auto_vacuum=INCREMENTAL pa održavanje ne vraća prazan prostor. "
+                "Prebacivanje pokreće puni VACUUM koji prepisuje cijelu datoteku i za to vrijeme "
+                "zaključava bazu - pokrenite ga kad nitko drugi ne radi u aplikaciji.")
+        if st.button("🗜️ Prebaci na auto_vacuum=INCREMENTAL"):
+            run_maintenance(db_path, convert_auto_vacuum=True)
+
+    st.markdown("#### Povijest održavanja")
+    history = evidencija_odrzavanje.get_maintenance_log(db_path)
+    if history:
+        st.dataframe(pd.DataFrame([{
+            'Pokrenuto': r['started_at'],
+            'Trajanje (ms)': r['duration_ms'],
+            'Integritet': r['integrity'],
+            'Veličina prije (KB)': round(r['before']['file_size'] / 1024, 1),
+            'Veličina poslije (KB)': round(r['after']['file_size'] / 1024, 1),
+            'Prazne stranice prije': r['before']['freelist_pages'],
+            'Prazne stranice poslije': r['after']['freelist_pages'],
+            'Koraci': ', '.join(f"{s['step']} {s['duration_ms']} ms" for s in r['steps'])
+        } for r in history]), use_container_width=True)
+    else:
+        st.info("Održavanje još nije pokretano.")
@@ -0,0 +1,22 @@
+"""Pregled zaposlenika - tablica staža, godišnjeg i pregleda za sve aktivne zaposlenike"""
+import streamlit as st
+import pandas as pd
+
+from evidencija_baza import build_overview_rows
+
+def render(db_path, db_name, databases):
+    rows = build_overview_rows(db_path)
+
+    df = pd.DataFrame(rows)
+
+    if df.empty:
+        st.warning("Nema zaposlenika u bazi!")
+    else:
+        st.dataframe(
+            df[
+                ["Ime", "Datum zapos.", "Staž prije", "Staž kod nas", "Ukupni staž",
+                 "Godišnji prema pravilniku (dana)", "Preostalo godišnji", "Sljedeći fiz. pregled", "Sljedeći psih. pregled"]
+            ].reset_index(drop=True),
+            use_container_width=True,
+            height=800
+        )
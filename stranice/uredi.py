@@ -0,0 +1,148 @@
+"""Dodaj/Uredi zaposlenika - forma za unos i izmjenu podataka"""
+import streamlit as st
+from datetime import datetime, date
+from dateutil.relativedelta import relativedelta
+
+from evidencija_baza import get_employees, add_employee, edit_employee, compute_tenure
+
+def render(db_path, db_name, databases):
+    employees = get_employees(db_path)
+    
+    # Odabir zaposlenika za uređivanje
+    selected_employee = None
+    if employees:
+        names = ["Novi zaposlenik"] + [emp['name'] for emp in employees]
+        selected = st.selectbox("Odaberi zaposlenika", names)
+        if selected != "Novi zaposlenik":
+            selected_employee = next(emp for emp in employees if emp['name'] == selected)
+    
+    # Forma za unos/uređivanje podataka
+    with st.form("employee_form"):
+        st.markdown("### Podaci o zaposleniku")
+        
+        # Osnovni podaci
+        col1, col2 = st.columns(2)
+        with col1:
+            name = st.text_input("Ime i prezime", value=selected_employee['name'] if selected_employee else "")
+            oib = st.text_input("OIB", value=selected_employee['oib'] if selected_employee else "")
+            address = st.text_input("Adresa", value=selected_employee['address'] if selected_employee else "")
+            birth_date = st.date_input(
+                "Datum rođenja",
+                value=None if not selected_employee or not selected_employee['birth_date'] 
+                      else datetime.strptime(selected_employee['birth_date'], '%Y-%m-%d').date(),
+                min_value=date(1950, 1, 1),
+                format="DD/MM/YYYY"
+            )
+            hire_date = st.date_input(
+                "Datum zaposlenja",
+                value=date.today() if not selected_employee 
+                      else datetime.strptime(selected_employee['hire_date'], '%Y-%m-%d').date(),
+                min_value=date(1950, 1, 1),
+                format="DD/MM/YYYY"
+            )
+        with col2:
+            st.markdown("### Socijalni uvjeti radnika")
+            invalidity = st.checkbox("Status invaliditeta (+5 dana)", value=selected_employee['invalidity'] if selected_employee else False)
+            children = st.number_input("Broj djece mlađe od 15 godina", min_value=0, value=selected_employee['children_under15'] if selected_employee else 0)
+            st.caption("Jedno dijete do 15 godina +1 dan, dvoje ili više djece mlađe od 15 godine +2 dana")
+            sole_caregiver = st.checkbox("Samohrani roditelj (+3 dana)", value=selected_employee['sole_caregiver'] if selected_employee else False)
+            st.markdown("### Složenost posla i radna odgovornost")
+            job_role_voditelj_odjela = st.checkbox("Voditelj odjela i poslovnih jedinica (+2 dana)", value=selected_employee['job_role_voditelj_odjela'] if selected_employee and 'job_role_voditelj_odjela' in selected_employee else False)
+            job_role_voditelj_grupe = st.checkbox("Voditelj grupe i poslovođa (+1 dan)", value=selected_employee['job_role_voditelj_grupe'] if selected_employee and 'job_role_voditelj_grupe' in selected_employee else False)
+            st.markdown("### Lojalnost i Učinak")
+            loyalty = st.checkbox("Lojalnost (+1 dan)", value=selected_employee['loyalty'] if selected_employee and 'loyalty' in selected_employee else False)
+            performance = st.checkbox("Učinak (+1 dan)", value=selected_employee['performance'] if selected_employee and 'performance' in selected_employee else False)
+
+        # Pregledi
+        st.markdown("### Pregledi")
+        col1, col2 = st.columns(2)
+        with col1:
+            next_physical = st.date_input(
+                "Datum sljedećeg fizičkog pregleda",
+                value=None if not selected_employee or not selected_employee['next_physical_date']
+                      else datetime.strptime(selected_employee['next_physical_date'], '%Y-%m-%d').date(),
+                format="DD/MM/YYYY"
+            )
+        with col2:
+            next_psych = st.date_input(
+                "Datum sljedećeg psihičkog pregleda",
+                value=None if not selected_employee or not selected_employee['next_psych_date']
+                      else datetime.strptime(selected_employee['next_psych_date'], '%Y-%m-%d').date(),
+                format="DD/MM/YYYY"
+            )
+        
+        # Staž prije
+        st.markdown("### Staž prije")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            years = st.number_input("Godine", min_value=0, value=(
+                selected_employee['previous_experience_days'] // 365 if selected_employee else 0
+            ))
+        with col2:
+            months = st.number_input("Mjeseci", min_value=0, max_value=11, value=(
+                (selected_employee['previous_experience_days'] % 365) // 30 if selected_employee else 0
+            ))
+        with col3:
+            days = st.number_input("Dani", min_value=0, max_value=30, value=(
+                (selected_employee['previous_experience_days'] % 365) % 30 if selected_employee else 0
+            ))
+
+        # Prikaz ukupnog staža za odabranog zaposlenika
+        if selected_employee:
+            # Staž prije
+            total_days = selected_employee.get('previous_experience_days', 0)
+            y = total_days // 365
+            rem = total_days % 365
+            m = rem // 30
+            d = rem % 30
+
+            # Staž kod nas
+            staz_kod_nas = compute_tenure(selected_employee['hire_date'])
+
+            # Ukupni staž
+            ukupni_staz = relativedelta(
+                years=staz_kod_nas.years + y,
+                months=staz_kod_nas.months + m,
+                days=staz_kod_nas.days + d
+            )
+
+            # Formatiraj prikaz
+            parts = []
+            if ukupni_staz.years: parts.append(f"{ukupni_staz.years}g")
+            if ukupni_staz.months: parts.append(f"{ukupni_staz.months}m")
+            if ukupni_staz.days: parts.append(f"{ukupni_staz.days}d")
+            ukupni_staz_str = " ".join(parts) if parts else "0d"
+
+            st.info(f"**Ukupni staž:** {ukupni_staz_str}")
+        
+        # Gumb za spremanje
+        submitted = st.form_submit_button("💾 Spremi")
+        
+        if submitted:
+            try:
+                data = {
+                    'name': name,
+                    'oib': oib,
+                    'address': address,
+                    'birth_date': birth_date.strftime('%Y-%m-%d') if birth_date else None,
+                    'hire_date': hire_date.strftime('%Y-%m-%d') if hire_date else None,
+                    'invalidity': invalidity,
+                    'children_under15': children,
+                    'sole_caregiver': sole_caregiver,
+                    'job_role_voditelj_odjela': int(job_role_voditelj_odjela),
+                    'job_role_voditelj_grupe': int(job_role_voditelj_grupe),
+                    'loyalty': int(loyalty),
+                    'performance': int(performance),
+                    'next_physical_date': next_physical.strftime('%Y-%m-%d') if next_physical else None,
+                    'next_psych_date': next_psych.strftime('%Y-%m-%d') if next_psych else None,
+                    'previous_experience_days': (years or 0) * 365 + (months or 0) * 30 + (days or 0)
+                }
+                
+                if selected_employee:
+                    edit_employee(selected_employee['id'], data, db_path)
+                    st.success("✅ Zaposlenik uspješno ažuriran!")
+                else:
+                    add_employee(data, db_path)
+                    st.success("✅ Zaposlenik uspješno dodan!")
+            except Exception as e:
+                st.error(f"❌ Greška prilikom dodavanja: {str(e)}")
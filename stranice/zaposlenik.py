@@ -0,0 +1,140 @@
+"""Pregledaj zaposlenika - podaci, staž i godišnji jednog zaposlenika te odjava"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime, date
+from dateutil.relativedelta import relativedelta
+
+import evidencija_baza
+from evidencija_baza import (
+    format_date, get_employees, get_leave_records, compute_tenure, format_rd,
+    compute_employee_leave, compute_used_days
+)
+from evidencija_dnevnik import get_employee_history, history_rows
+
+# Odjava zaposlenika - podaci se ne brišu nego premještaju u arhivu
+def terminate_employee(emp_id, termination_date, db_path=None):
+    try:
+        evidencija_baza.terminate_employee(emp_id, termination_date, db_path)
+        return True
+    except Exception as e:
+        st.error(f"❌ Greška prilikom odjave: {str(e)}")
+        return False
+
+def cancel_termination(emp_id, db_path=None):
+    try:
+        return evidencija_baza.cancel_termination(emp_id, db_path)
+    except Exception as e:
+        st.error(f"❌ Greška prilikom poništavanja odjave: {str(e)}")
+        return False
+
+def render(db_path, db_name, databases):
+    employees = get_employees(db_path)
+    if not employees:
+        st.warning("Nema zaposlenika u bazi.")
+        return
+        
+    selected = st.selectbox("Odaberi zaposlenika", [emp['name'] for emp in employees])
+    emp = next(emp for emp in employees if emp['name'] == selected)
+    
+    st.markdown("### Podaci o zaposleniku")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write(f"**Ime i prezime:** {emp['name']}")
+        st.write(f"**OIB:** {emp['oib'] or 'Nije unesen'}")
+        st.write(f"**Adresa:** {emp['address'] or 'Nije unesena'}")
+        st.write(f"**Datum rođenja:** {format_date(emp['birth_date']) or 'Nije unesen'}")
+        st.write(f"**Datum zaposlenja:** {format_date(emp['hire_date'])}")
+    
+    with col2:
+        st.write("**Status invaliditeta:** ✅" if emp['invalidity'] else "**Status invaliditeta:** ❌")
+        st.write(f"**Broj djece <15:** {emp['children_under15']}")
+        st.write("**Samohrani roditelj:** ✅" if emp['sole_caregiver'] else "**Samohrani roditelj:** ❌")
+        st.write("**Voditelj odjela i poslovnih jedinica:** ✅" if emp.get('job_role_voditelj_odjela', 0) else "**Voditelj odjela i poslovnih jedinica:** ❌")
+        st.write("**Voditelj grupe i poslovođa:** ✅" if emp.get('job_role_voditelj_grupe', 0) else "**Voditelj grupe i poslovođa:** ❌")
+        st.write("**Lojalnost:** ✅" if emp.get('loyalty', 0) else "**Lojalnost:** ❌")
+        st.write("**Učinak:** ✅" if emp.get('performance', 0) else "**Učinak:** ❌")
+        st.write(f"**Fizički pregled:** {format_date(emp['next_physical_date']) or 'Nema pregleda'}")
+        st.write(f"**Psihički pregled:** {format_date(emp['next_psych_date']) or 'Nema pregleda'}")
+
+    # Staž prije
+    total_days = emp.get('previous_experience_days', 0)
+    years = total_days // 365
+    remaining_days = total_days % 365
+    months = remaining_days // 30
+    days = remaining_days % 30
+    
+    staz_prije = []
+    if years: staz_prije.append(f"{years}g")
+    if months: staz_prije.append(f"{months}m")
+    if days: staz_prije.append(f"{days}d")
+    staz_prije_str = " ".join(staz_prije) if staz_prije else "0d"
+    
+    # Staž kod nas
+    staz_kod_nas = compute_tenure(emp['hire_date'])
+    staz_kod_nas_str = format_rd(staz_kod_nas)
+    
+    # Ukupni staž
+    ukupni_staz = relativedelta(date.today(), datetime.strptime(emp['hire_date'], '%Y-%m-%d').date())
+    ukupni_staz = relativedelta(years=ukupni_staz.years + years,
+                              months=ukupni_staz.months + months,
+                              days=ukupni_staz.days + days)
+    ukupni_staz_str = format_rd(ukupni_staz)
+    
+    st.write(f"**Staž prije:** {staz_prije_str}")
+    st.write(f"**Staž kod nas:** {staz_kod_nas_str}")
+    st.write(f"**Ukupni staž:** {ukupni_staz_str}")
+
+    # Godišnji odmor
+    st.markdown("### Godišnji odmor")
+    leave_days = compute_employee_leave(emp)
+    
+    # Računanje iskorištenih dana
+    leave_records = get_leave_records(emp['id'], db_path)
+    used_days = compute_used_days(leave_records)
+    
+    remaining_days = leave_days - used_days
+    
+    st.write(f"**Godišnji prema pravilniku (dana):** {leave_days}")
+    st.write(f"**Preostali godišnji:** {remaining_days} dana")
+
+    # Tko je i kada mijenjao podatke i godišnji zaposlenika
+    with st.expander("Povijest promjena"):
+        history = get_employee_history(emp['id'], db_path)
+        if history:
+            st.dataframe(pd.DataFrame(history_rows(history)), use_container_width=True, hide_index=True)
+        else:
+            st.info("Nema zabilježenih promjena.")
+
+    # Odjava zaposlenika na dnu - zaposlenik se premješta u arhivu
+    st.write("---")  # Horizontalna linija za odvajanje
+    st.markdown("### Prestanak radnog odnosa")
+    if emp.get('termination_date'):
+        st.info(f"Radni odnos prestaje {format_date(emp['termination_date'])}. "
+                "Tog dana zaposlenik se premješta u arhivu.")
+        # Do premještanja u arhivu odjava se još može poništiti
+        if st.button("↩️ Poništi odjavu"):
+            if cancel_termination(emp['id'], db_path):
+                st.success("✅ Odjava je poništena!")
+                st.rerun()
+    with st.form("odjava_forma"):
+        termination_date = st.date_input(
+            "Datum prestanka radnog odnosa",
+            value=date.today(),
+            min_value=datetime.strptime(emp['hire_date'], '%Y-%m-%d').date(),
+            format="DD/MM/YYYY"
+        )
+        # Arhiviranje se ne može poništiti iz aplikacije - traži se izričita potvrda
+        confirmed = st.checkbox(
+            f"Potvrđujem odjavu zaposlenika {emp['name']}. Na datum prestanka zaposlenik i "
+            "njegova evidencija godišnjih premještaju se u arhivu i to se ne može poništiti."
+        )
+        if st.form_submit_button("📦 Odjavi zaposlenika"):
+            if not confirmed:
+                st.warning("⚠️ Za odjavu označite potvrdu iznad gumba.")
+            elif terminate_employee(emp['id'], termination_date.strftime('%Y-%m-%d'), db_path):
+                if termination_date <= date.today():
+                    st.success("✅ Zaposlenik je odjavljen i premješten u arhivu!")
+                else:
+                    st.success(f"✅ Odjava zabilježena za {termination_date.strftime('%d/%m/%Y')}!")
+                st.rerun()
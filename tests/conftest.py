@@ -0,0 +1,5 @@
+# Moduli aplikacije su u korijenu repozitorija, pored foldera tests/
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
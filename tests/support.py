@@ -0,0 +1,32 @@
+"""Zajednički podaci za testove i privremena baza za svaki test"""
+import os
+import tempfile
+import unittest
+
+from evidencija_baza import init_db, add_employee
+
+EMPLOYEE = {
+    'name': "Ana Anić", 'oib': "12345678901", 'address': "Zagreb",
+    'birth_date': "1985-01-01", 'hire_date': "2015-03-01",
+    'next_physical_date': "2030-01-15", 'next_psych_date': None,
+    'invalidity': False, 'children_under15': 0, 'sole_caregiver': False,
+    'previous_experience_days': 0, 'job_role_voditelj_odjela': False,
+    'job_role_voditelj_grupe': False, 'loyalty': False, 'performance': False
+}
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """Svaki test dobiva novu bazu employees.db sa zaposlenicima iz EMPLOYEES"""
+    EMPLOYEES = ["Ana Anić"]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db_path = self.new_database("employees.db", self.EMPLOYEES)
+
+    def new_database(self, name, employees):
+        db_path = os.path.join(self.tmp.name, name)
+        init_db(db_path)
+        for employee in employees:
+            add_employee(dict(EMPLOYEE, name=employee), db_path)
+        return db_path
@@ -0,0 +1,174 @@
+"""
+Testovi HTTP API-ja: keširanje verzije podataka, uvjetni zahtjevi (ETag,
+If-Modified-Since) i redoslijed razrješavanja rute i 304 odgovora.
+
+    python -m pytest -q tests
+"""
+import os
+import sqlite3
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+from unittest import mock
+
+import evidencija_api
+import evidencija_baza
+import evidencija_dnevnik
+from evidencija_api import ApiError, ApiHandler, DataVersionCache, ThreadPoolHTTPServer
+from evidencija_baza import add_days_adjustment, get_data_version
+from support import DatabaseTestCase
+
+
+class ApiTestCase(DatabaseTestCase):
+    """Privremena baza kao zadana baza API-ja"""
+
+    def setUp(self):
+        super().setUp()
+        for patcher in (mock.patch.object(evidencija_baza, 'DB_PATH', self.db_path),
+                        mock.patch.object(evidencija_dnevnik, 'DB_PATH', self.db_path),
+                        mock.patch.object(evidencija_api, 'balance_store', evidencija_dnevnik.BalanceStore())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class DataVersionCacheTest(ApiTestCase):
+    def test_returns_current_version(self):
+        cache = DataVersionCache(self.db_path)
+        self.assertEqual(cache.get(), get_data_version(self.db_path))
+        add_days_adjustment(1, 2, db_path=self.db_path)
+        self.assertEqual(cache.get(), get_data_version(self.db_path))
+
+    def test_write_after_version_read_is_not_lost(self):
+        cache = DataVersionCache(self.db_path)
+        read_version = evidencija_api.get_data_version
+
+        def read_then_write(db_path):
+            version = read_version(db_path)
+            # Promjena stiže nakon čitanja verzije, a prije spremanja potpisa
+            add_days_adjustment(1, 2, db_path=self.db_path)
+            return version
+
+        with mock.patch.object(evidencija_api, 'get_data_version', read_then_write):
+            stale = cache.get()
+        self.assertLess(stale[0], get_data_version(self.db_path)[0])
+        self.assertEqual(cache.get(), get_data_version(self.db_path))
+
+    def test_reads_its_own_database(self):
+        other = self.new_database("druga.db", ["Ivo", "Marko"])
+        self.assertNotEqual(get_data_version(other), get_data_version(self.db_path))
+        self.assertEqual(DataVersionCache(other).get(), get_data_version(other))
+
+    def test_missing_database_is_not_created(self):
+        missing = os.path.join(self.tmp.name, "nema.db")
+        with self.assertRaises(ApiError) as ctx:
+            DataVersionCache(missing).get()
+        self.assertEqual(ctx.exception.status, 503)
+        self.assertFalse(os.path.exists(missing))
+
+    def test_uninitialized_database_is_not_migrated(self):
+        legacy = os.path.join(self.tmp.name, "stara.db")
+        conn = sqlite3.connect(legacy)
+        conn.execute("CREATE TABLE employees (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.close()
+        with self.assertRaises(ApiError) as ctx:
+            DataVersionCache(legacy).get()
+        self.assertEqual(ctx.exception.status, 503)
+        conn = sqlite3.connect(legacy)
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        conn.close()
+        self.assertEqual(tables, {'employees'})
+
+
+class NotModifiedTest(unittest.TestCase):
+    ETAG = '"abc-5-2026-10-19"'
+    LAST_MODIFIED = datetime(2026, 10, 19, 8, 30, tzinfo=timezone.utc)
+
+    def not_modified(self, **headers):
+        handler = SimpleNamespace(headers={k.replace('_', '-'): v for k, v in headers.items()})
+        return ApiHandler._not_modified(handler, self.ETAG, self.LAST_MODIFIED)
+
+    def test_without_conditional_headers(self):
+        self.assertFalse(self.not_modified())
+
+    def test_if_none_match(self):
+        self.assertTrue(self.not_modified(If_None_Match=self.ETAG))
+        self.assertTrue(self.not_modified(If_None_Match=f'"x", W/{self.ETAG}'))
+        self.assertTrue(self.not_modified(If_None_Match='*'))
+        self.assertFalse(self.not_modified(If_None_Match='"abc-4-2026-10-19"'))
+
+    def test_if_none_match_takes_precedence(self):
+        since = format_datetime(self.LAST_MODIFIED, usegmt=True)
+        self.assertFalse(self.not_modified(If_None_Match='"staro"', If_Modified_Since=since))
+
+    def test_if_modified_since(self):
+        self.assertTrue(self.not_modified(If_Modified_Since=format_datetime(self.LAST_MODIFIED, usegmt=True)))
+        earlier = datetime(2026, 10, 19, 8, 0, tzinfo=timezone.utc)
+        self.assertFalse(self.not_modified(If_Modified_Since=format_datetime(earlier, usegmt=True)))
+        self.assertFalse(self.not_modified(If_Modified_Since="nije datum"))
+
+
+class ConditionalRequestTest(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        quiet = mock.patch.object(ApiHandler, 'log_message', lambda *args: None)
+        quiet.start()
+        self.addCleanup(quiet.stop)
+        self.server = ThreadPoolHTTPServer(('127.0.0.1', 0), ApiHandler, workers=2)
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def request(self, path, etag=None):
+        req = urllib.request.Request(self.base_url + path)
+        if etag:
+            req.add_header('If-None-Match', etag)
+        try:
+            with urllib.request.urlopen(req) as response:
+                return response.status, response.headers.get('ETag')
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers.get('ETag')
+
+    def test_unchanged_data_returns_304(self):
+        status, etag = self.request('/api/employees/1')
+        self.assertEqual(status, 200)
+        self.assertEqual(self.request('/api/employees/1', etag)[0], 304)
+
+    def test_change_invalidates_etag(self):
+        _, etag = self.request('/api/balances')
+        add_days_adjustment(1, 2, db_path=self.db_path)
+        self.assertEqual(self.request('/api/balances', etag)[0], 200)
+
+    def test_route_errors_win_over_etag(self):
+        _, etag = self.request('/api/employees')
+        self.assertEqual(self.request('/api/employees/99', etag)[0], 404)
+        self.assertEqual(self.request('/api/exam-alerts?days=x', etag)[0], 400)
+
+    def test_etag_is_per_resource(self):
+        _, balances_etag = self.request('/api/balances')
+        self.assertEqual(self.request('/api/employees', balances_etag)[0], 200)
+        _, etag = self.request('/api/exam-alerts?days=30')
+        self.assertEqual(self.request('/api/exam-alerts', etag)[0], 304)
+        self.assertEqual(self.request('/api/exam-alerts?days=7', etag)[0], 200)
+
+    def test_304_does_not_query_sqlite(self):
+        for path in ('/api/employees', '/api/employees/1/leave', '/api/balances'):
+            with self.subTest(path=path):
+                _, etag = self.request(path)
+                with mock.patch('sqlite3.connect', wraps=sqlite3.connect) as connect:
+                    self.assertEqual(self.request(path, etag)[0], 304)
+                self.assertEqual(connect.call_count, 0)
+
+    def test_replaced_database_gets_new_etag(self):
+        _, etag = self.request('/api/employees')
+        evidencija_baza.new_data_generation(self.db_path)
+        self.assertEqual(self.request('/api/employees', etag)[0], 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Testovi evidencija_baza: odjava i arhiviranje zaposlenika (premještanje u
+jednoj transakciji, poništavanje odjave) i dodjela ID-a novom zaposleniku.
+
+    python -m pytest -q tests
+"""
+import sqlite3
+import threading
+import unittest
+from datetime import date, timedelta
+
+from evidencija_baza import (
+    add_employee, add_leave_record, cancel_termination, get_archived_employees,
+    get_archived_leave_records, get_employees, get_leave_records, terminate_employee
+)
+from evidencija_dnevnik import get_changes
+from support import EMPLOYEE, DatabaseTestCase
+
+YESTERDAY = (date.today() - timedelta(days=1)).isoformat()
+NEXT_MONTH = (date.today() + timedelta(days=30)).isoformat()
+
+
+class TerminationTest(DatabaseTestCase):
+    EMPLOYEES = ["Ana", "Ivo"]
+
+    def setUp(self):
+        super().setUp()
+        add_leave_record(1, "2026-01-05", "2026-01-09", self.db_path)
+
+    def test_past_date_moves_employee_and_leave_to_archive(self):
+        terminate_employee(1, YESTERDAY, self.db_path)
+        self.assertEqual([e['id'] for e in get_employees(self.db_path)], [2])
+        self.assertEqual(get_leave_records(1, self.db_path), [])
+        archived = get_archived_employees(self.db_path)
+        self.assertEqual([(e['id'], e['termination_date']) for e in archived], [(1, YESTERDAY)])
+        self.assertEqual(len(get_archived_leave_records(1, self.db_path)), 1)
+
+    def test_future_date_waits_for_that_day(self):
+        terminate_employee(1, NEXT_MONTH, self.db_path)
+        employee = next(e for e in get_employees(self.db_path) if e['id'] == 1)
+        self.assertEqual(employee['termination_date'], NEXT_MONTH)
+        self.assertEqual(get_archived_employees(self.db_path), [])
+
+    def test_archiving_is_one_transaction(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""CREATE TRIGGER test_no_delete BEFORE DELETE ON employees
+                        BEGIN SELECT RAISE(ABORT, 'test'); END""")
+        conn.commit()
+        conn.close()
+        with self.assertRaises(sqlite3.IntegrityError):
+            terminate_employee(1, YESTERDAY, self.db_path)
+        # Ništa nije premješteno - ni godišnji koji su obrisani prije zaposlenika
+        self.assertEqual(get_archived_employees(self.db_path), [])
+        self.assertEqual(get_archived_leave_records(1, self.db_path), [])
+        self.assertEqual(len(get_leave_records(1, self.db_path)), 1)
+        conn = sqlite3.connect(self.db_path)
+        self.addCleanup(conn.close)
+        self.assertEqual(conn.execute('SELECT termination_date FROM employees WHERE id=1').fetchone(),
+                         (YESTERDAY,))
+
+    def test_cancel_termination(self):
+        terminate_employee(1, NEXT_MONTH, self.db_path)
+        self.assertTrue(cancel_termination(1, self.db_path))
+        self.assertFalse(cancel_termination(1, self.db_path))
+        employee = next(e for e in get_employees(self.db_path) if e['id'] == 1)
+        self.assertIsNone(employee['termination_date'])
+        last = get_changes(emp_id=1, db_path=self.db_path)[-1]
+        self.assertEqual(last['operation'], 'UPDATE')
+        self.assertEqual((last['old']['termination_date'], last['new']['termination_date']),
+                         (NEXT_MONTH, None))
+
+
+class EmployeeIdTest(DatabaseTestCase):
+    EMPLOYEES = ["Ana", "Ivo"]
+
+    def test_archived_ids_are_not_reused(self):
+        terminate_employee(2, YESTERDAY, self.db_path)
+        add_employee(dict(EMPLOYEE, name="Marko"), self.db_path)
+        self.assertEqual([e['id'] for e in get_employees(self.db_path)], [1, 3])
+
+    def test_concurrent_adds_get_distinct_ids(self):
+        names = [f"Zaposlenik {i}" for i in range(8)]
+        threads = [threading.Thread(target=add_employee, args=(dict(EMPLOYEE, name=name), self.db_path))
+                   for name in names]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        ids = [e['id'] for e in get_employees(self.db_path)]
+        self.assertEqual(len(ids), len(self.EMPLOYEES) + len(names))
+        self.assertEqual(sorted(ids), list(range(1, len(ids) + 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Testovi dnevnika promjena: JournalConsumer (checkpoint, serije) i
+BalanceStore (inkrementalni izračun, ponovni izračun kod nove baze ili dana).
+
+    python -m pytest -q tests
+"""
+import shutil
+import sqlite3
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+import evidencija_dnevnik
+from evidencija_baza import (
+    add_leave_record, add_days_adjustment, terminate_employee, get_employees
+)
+from evidencija_dnevnik import BalanceStore, JournalConsumer, balance_row, get_changes
+from support import DatabaseTestCase
+
+
+class JournalTestCase(DatabaseTestCase):
+    EMPLOYEES = ["Ana", "Ivo"]
+
+    def expected_balances(self, db_path):
+        return [balance_row(e, db_path) for e in sorted(get_employees(db_path), key=lambda e: e['id'])]
+
+
+class JournalConsumerTest(JournalTestCase):
+    def test_poll_applies_changes_in_batches_and_saves_checkpoint(self):
+        add_leave_record(1, "2026-01-05", "2026-01-09", self.db_path)
+        batches = []
+        consumer = JournalConsumer("test", self.db_path, batch_size=2)
+        self.assertEqual(consumer.poll(batches.append), 3)
+        self.assertEqual([len(b) for b in batches], [2, 1])
+        self.assertEqual(consumer.pending(), 0)
+        # Novi potrošač s istim imenom nastavlja od spremljenog checkpointa
+        add_days_adjustment(2, 1, db_path=self.db_path)
+        self.assertEqual(JournalConsumer("test", self.db_path).pending(), 1)
+
+    def test_failed_batch_is_delivered_again(self):
+        consumer = JournalConsumer("test", self.db_path)
+
+        def fail(changes):
+            raise RuntimeError("greška potrošača")
+
+        with self.assertRaises(RuntimeError):
+            consumer.poll(fail)
+        self.assertEqual(consumer.seq, 0)
+        self.assertEqual(consumer.poll(lambda changes: None), 2)
+
+    def test_archive_is_journaled_as_archive(self):
+        add_leave_record(1, "2026-01-05", "2026-01-09", self.db_path)
+        terminate_employee(1, (date.today() - timedelta(days=1)).isoformat(), self.db_path)
+        operations = [(c['table'], c['operation']) for c in get_changes(emp_id=1, db_path=self.db_path)]
+        self.assertIn(('leave_records', 'ARCHIVE'), operations)
+        self.assertIn(('employees', 'ARCHIVE'), operations)
+        self.assertNotIn(('leave_records', 'DELETE'), operations)
+
+    def test_journal_is_append_only(self):
+        conn = sqlite3.connect(self.db_path)
+        self.addCleanup(conn.close)
+        for sql in ("DELETE FROM change_journal",
+                    "UPDATE change_journal SET changed_by = 'netko'"):
+            with self.subTest(sql=sql), self.assertRaisesRegex(sqlite3.IntegrityError, "samo za dodavanje"):
+                conn.execute(sql)
+        self.assertEqual(len(get_changes(db_path=self.db_path)), 2)
+
+
+class BalanceStoreTest(JournalTestCase):
+    def test_initial_build(self):
+        store = BalanceStore(self.db_path)
+        self.assertEqual(store.balances(), self.expected_balances(self.db_path))
+
+    def test_recomputes_only_changed_employees(self):
+        store = BalanceStore(self.db_path)
+        store.refresh()
+        add_leave_record(2, "2026-01-05", "2026-01-09", self.db_path)
+        with mock.patch.object(evidencija_dnevnik, 'balance_row', wraps=balance_row) as row:
+            self.assertEqual(store.refresh(), 1)
+        self.assertEqual([call.args[0]['id'] for call in row.call_args_list], [2])
+        self.assertEqual(store.balances(), self.expected_balances(self.db_path))
+
+    def test_archived_employee_is_removed(self):
+        store = BalanceStore(self.db_path)
+        store.refresh()
+        terminate_employee(1, (date.today() - timedelta(days=1)).isoformat(), self.db_path)
+        self.assertEqual([b['emp_id'] for b in store.balances()], [2])
+
+    def test_rebuilds_on_new_day(self):
+        store = BalanceStore(self.db_path)
+        store.refresh()
+        tomorrow = date.today() + timedelta(days=1)
+        with mock.patch.object(evidencija_dnevnik, 'date', mock.Mock(today=lambda: tomorrow)):
+            with mock.patch.object(evidencija_dnevnik, 'balance_row', wraps=balance_row) as row:
+                store.refresh()
+        self.assertEqual(row.call_count, 2)
+
+    def test_rebuilds_when_database_is_replaced(self):
+        store = BalanceStore(self.db_path)
+        store.refresh()
+        # Druga baza s duljim dnevnikom - seq brojevi idu dalje od checkpointa
+        other = self.new_database("druga.db", ["Marko", "Petra", "Iva"])
+        add_leave_record(3, "2026-02-02", "2026-02-06", other)
+        shutil.copyfile(other, self.db_path)
+        self.assertEqual(store.balances(), self.expected_balances(other))
+
+
+if __name__ == '__main__':
+    unittest.main()
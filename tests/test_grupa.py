@@ -0,0 +1,44 @@
+"""
+Testovi registra baza: baze iz registra kojih nema preskaču se i ne stvaraju.
+
+    python -m pytest -q tests
+"""
+import json
+import os
+import unittest
+from unittest import mock
+
+import evidencija_grupa
+from evidencija_grupa import DEFAULT_DB_NAME, REGISTRY_ENV, load_available_databases
+from support import DatabaseTestCase
+
+
+class RegistryTest(DatabaseTestCase):
+    def write_registry(self, entries):
+        path = os.path.join(self.tmp.name, "baze.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        return path
+
+    def test_missing_databases_are_reported_and_not_created(self):
+        registry = self.write_registry({
+            "Zagreb": "employees.db",
+            "Split": "split/employees.db",
+            "Rijeka": "rjieka.db"
+        })
+        with mock.patch.dict(os.environ, {REGISTRY_ENV: registry}):
+            available, missing = load_available_databases()
+        self.assertEqual(available, {"Zagreb": self.db_path})
+        self.assertEqual(list(missing), ["Split", "Rijeka"])
+        for db_path in missing.values():
+            self.assertFalse(os.path.exists(db_path))
+
+    def test_default_database_without_registry(self):
+        missing_registry = os.path.join(self.tmp.name, "nema.json")
+        with mock.patch.dict(os.environ, {REGISTRY_ENV: missing_registry}), \
+                mock.patch.object(evidencija_grupa, 'DB_PATH', self.db_path):
+            self.assertEqual(load_available_databases(), ({DEFAULT_DB_NAME: self.db_path}, {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
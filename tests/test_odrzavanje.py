@@ -0,0 +1,64 @@
+"""
+Testovi održavanja baze: automatsko održavanje ne pokreće puni VACUUM,
+a neuspjela pokretanja bilježe se umjesto da se izgube.
+
+    python -m pytest -q tests
+"""
+import os
+import sqlite3
+import unittest
+from unittest import mock
+
+import evidencija_odrzavanje
+from evidencija_odrzavanje import (
+    get_db_stats, get_maintenance_log, maintenance_due, run_maintenance, run_scheduled
+)
+from support import DatabaseTestCase
+
+
+class AutoVacuumTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        # Nove baze init_db odmah stvara s INCREMENTAL - ovako izgleda starija baza
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA auto_vacuum = NONE')
+        conn.execute('VACUUM')
+        conn.close()
+
+    def test_scheduled_run_does_not_convert(self):
+        run_scheduled([self.db_path])
+        self.assertEqual(get_db_stats(self.db_path)['auto_vacuum'], 'NONE')
+        steps = {s['step']: s['result'] for s in get_maintenance_log(self.db_path)[0]['steps']}
+        self.assertTrue(steps['auto_vacuum'].startswith('preskočeno'))
+
+    def test_conversion_on_demand(self):
+        report = run_maintenance(self.db_path, convert_auto_vacuum=True)
+        self.assertEqual(report['after']['auto_vacuum'], 'INCREMENTAL')
+        steps = [s['step'] for s in run_maintenance(self.db_path)['steps']]
+        self.assertIn('incremental_vacuum', steps)
+
+
+class SchedulerTest(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(evidencija_odrzavanje.scheduler_errors.clear)
+
+    def test_failure_is_logged_and_retried(self):
+        with mock.patch.object(evidencija_odrzavanje, 'run_maintenance',
+                               side_effect=RuntimeError("baza je zaključana")):
+            run_scheduled([self.db_path])
+        log = get_maintenance_log(self.db_path)
+        self.assertEqual([r['integrity'] for r in log], ["greška: baza je zaključana"])
+        self.assertTrue(maintenance_due(self.db_path))
+        self.assertEqual(evidencija_odrzavanje.scheduler_errors, {})
+
+    def test_missing_database_is_skipped(self):
+        missing = os.path.join(self.tmp.name, "nema.db")
+        run_scheduled([missing, self.db_path])
+        self.assertFalse(os.path.exists(missing))
+        self.assertIn(missing, evidencija_odrzavanje.scheduler_errors)
+        self.assertFalse(maintenance_due(self.db_path))
+
+
+if __name__ == '__main__':
+    unittest.main()